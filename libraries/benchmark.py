@@ -0,0 +1,262 @@
+from __future__ import annotations
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import contextlib
+import gc
+import inspect
+import io
+import json
+import math
+from pathlib import Path
+import re
+import statistics
+import time
+from types import ModuleType
+from libraries.print_util import make_bold, make_gray, make_red
+from libraries.questions import get_answer_module
+
+
+_SOLUTIONS_DIR = Path(__file__).resolve().parents[1].joinpath("solutions")
+
+
+@dataclass
+class PartTiming:
+    """Timing statistics (in ms) for repeated runs of a single `part_N` function"""
+
+    name: str
+    repeats: int
+    min_ms: float
+    median_ms: float
+    p95_ms: float
+    samples_ms: list[float]
+
+
+def discover_days() -> list[int]:
+    """Returns all day numbers which have a `solutions/dayN.py` module, in order"""
+    days = []
+    for path in _SOLUTIONS_DIR.glob("day*.py"):
+        if match := re.fullmatch(r"day(\d+)", path.stem):
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def discover_parts(answer_module: ModuleType) -> dict[int, Callable]:
+    """Returns all `part_N` functions defined in `answer_module`, keyed by N"""
+    parts = {}
+    for name, func in inspect.getmembers(answer_module, inspect.isfunction):
+        if match := re.fullmatch(r"part_(\d+)", name):
+            parts[int(match.group(1))] = func
+    return dict(sorted(parts.items()))
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`"""
+    ordered = sorted(samples)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def time_part(func: Callable, warmup: int = 1, repeats: int = 5) -> list[float]:
+    """Calls `func` `warmup` times untimed, then `repeats` times timed.
+
+    Solution output is discarded, and garbage collection is disabled
+    while timing so collector pauses don't land on random samples.
+    Returns the timed samples in ms.
+    """
+    samples: list[float] = []
+
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        for _ in range(warmup):
+            func()
+            sink.seek(0)
+            sink.truncate()
+
+        gc_was_enabled = gc.isenabled()
+        try:
+            for _ in range(repeats):
+                gc.collect()
+                gc.disable()
+                start = time.perf_counter()
+                func()
+                end = time.perf_counter()
+                if gc_was_enabled:
+                    gc.enable()
+                samples.append((end - start) * 1000)
+                sink.seek(0)
+                sink.truncate()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    return samples
+
+
+def benchmark_part(
+    day: int, part: int, func: Callable, warmup: int = 1, repeats: int = 5
+) -> PartTiming:
+    samples = time_part(func, warmup, repeats)
+    return PartTiming(
+        name=f"solutions.day{day}.part_{part}",
+        repeats=repeats,
+        min_ms=min(samples),
+        median_ms=statistics.median(samples),
+        p95_ms=_percentile(samples, 95),
+        samples_ms=samples,
+    )
+
+
+def run_benchmarks(
+    days: list[int] | None = None,
+    parts: list[int] | None = None,
+    warmup: int = 1,
+    repeats: int = 5,
+) -> list[PartTiming]:
+    """Benchmark every `part_N` of every requested day (all discovered days if
+    `days` is not given). Progress is reported as each part completes.
+    """
+    results: list[PartTiming] = []
+
+    for day in days or discover_days():
+        answer_mod = get_answer_module(str(day))
+        for part, func in discover_parts(answer_mod).items():
+            if parts and part not in parts:
+                continue
+            print(make_gray(f"Benchmarking day {day} part {part}..."), flush=True)
+            results.append(benchmark_part(day, part, func, warmup, repeats))
+
+    return results
+
+
+def print_report(results: list[PartTiming]):
+    header = f"{'part':<24} {'min (ms)':>12} {'median (ms)':>12} {'p95 (ms)':>12}"
+    print(make_bold(header))
+    print(make_gray("-" * len(header)))
+    for r in results:
+        print(f"{r.name:<24} {r.min_ms:>12.3f} {r.median_ms:>12.3f} {r.p95_ms:>12.3f}")
+
+
+def write_json(results: list[PartTiming], path: str | Path):
+    with open(path, "w") as fp:
+        json.dump({"results": [asdict(r) for r in results]}, fp, indent=2)
+
+
+def load_json(path: str | Path) -> list[PartTiming]:
+    with open(path) as fp:
+        return [PartTiming(**r) for r in json.load(fp)["results"]]
+
+
+@dataclass
+class PartComparison:
+    """Comparison of a part's timings against its baseline timings"""
+
+    name: str
+    baseline_median_ms: float
+    median_ms: float
+    change_pct: float
+    p_value: float
+    regressed: bool
+    # Too few samples for any result to reach significance, so `regressed`
+    # can't be True however much slower the part is
+    underpowered: bool = False
+
+
+def _mann_whitney_p(baseline: list[float], current: list[float]) -> float:
+    """One-sided Mann-Whitney U test p-value for `current` being slower than
+    `baseline`, using the normal approximation with a tie correction.
+    """
+    n1, n2 = len(baseline), len(current)
+    combined = sorted(
+        [(v, 0) for v in baseline] + [(v, 1) for v in current], key=lambda x: x[0]
+    )
+
+    # Assign average ranks to tied values
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    # Continuity-corrected z-score; large U means `current` tends to be larger
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def min_p_value(num_baseline: int, num_current: int) -> float:
+    """The smallest p-value `_mann_whitney_p` can give for these sample sizes,
+    when every current sample is slower than every baseline sample
+    """
+    return _mann_whitney_p(
+        list(range(num_baseline)), list(range(num_baseline, num_baseline + num_current))
+    )
+
+
+def compare_to_baseline(
+    results: list[PartTiming],
+    baseline: list[PartTiming],
+    threshold_pct: float = 10.0,
+    alpha: float = 0.05,
+) -> list[PartComparison]:
+    """Compare `results` against `baseline` part by part.
+
+    A part has regressed when its samples are significantly slower (one-sided
+    Mann-Whitney U, `alpha` significance) than the baseline samples inflated by
+    `threshold_pct`, i.e. it is confidently more than `threshold_pct` slower
+    rather than slower by one noisy sample. Parts missing from the baseline
+    are skipped. Parts with too few samples to ever reach `alpha` are marked
+    `underpowered`, so callers don't mistake them for passing.
+    """
+    scale = 1 + threshold_pct / 100
+    baseline_by_name = {b.name: b for b in baseline}
+    comparisons: list[PartComparison] = []
+
+    for r in results:
+        if (b := baseline_by_name.get(r.name)) is None:
+            continue
+
+        change_pct = (r.median_ms - b.median_ms) / b.median_ms * 100
+        p_value = _mann_whitney_p([v * scale for v in b.samples_ms], r.samples_ms)
+        comparisons.append(
+            PartComparison(
+                name=r.name,
+                baseline_median_ms=b.median_ms,
+                median_ms=r.median_ms,
+                change_pct=change_pct,
+                p_value=p_value,
+                regressed=p_value < alpha,
+                underpowered=min_p_value(len(b.samples_ms), len(r.samples_ms)) >= alpha,
+            )
+        )
+
+    return comparisons
+
+
+def print_comparison(comparisons: list[PartComparison]):
+    header = (
+        f"{'part':<24} {'base (ms)':>12} {'now (ms)':>12} {'change':>9} {'p':>7}"
+    )
+    print(make_bold(header))
+    print(make_gray("-" * len(header)))
+    for c in comparisons:
+        line = (
+            f"{c.name:<24} {c.baseline_median_ms:>12.3f} {c.median_ms:>12.3f}"
+            f" {c.change_pct:>+8.1f}% {c.p_value:>7.3f}"
+        )
+        if c.regressed:
+            line = make_red(line + "  REGRESSED")
+        elif c.underpowered:
+            line = make_red(line + "  TOO FEW SAMPLES")
+        print(line)
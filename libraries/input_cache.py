@@ -0,0 +1,83 @@
+from __future__ import annotations
+from collections.abc import Callable
+import functools
+import hashlib
+import os
+from pathlib import Path
+import pickle
+from typing import TypeVar
+from libraries.questions import get_input_path, input_is_stdin
+
+
+T = TypeVar("T")
+
+CACHE_DIR = Path(__file__).resolve().parents[1].joinpath(".cache/parsed")
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Set to False (e.g. by `main.py --no-cache`) to always re-parse inputs
+enabled = True
+
+
+def _hash_file(filename: Path) -> str:
+    digest = hashlib.sha256()
+    with open(filename, "rb") as fp:
+        while chunk := fp.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _evict(max_bytes: int):
+    """Delete least recently used cache entries until the cache fits in `max_bytes`"""
+    entries = [(p, p.stat()) for p in CACHE_DIR.glob("*.pickle")]
+    total = sum(st.st_size for _, st in entries)
+
+    for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= st.st_size
+
+
+def cached_parse(day: int, version: int = 1):
+    """Decorator for a zero-argument function parsing the input of advent `day`.
+
+    The parsed result is pickled to disk, keyed by the input file's content
+    hash along with the parser's name and `version`, so subsequent calls skip
+    parsing until either the input file changes or `version` is bumped.
+    Each call returns a freshly loaded copy, so callers may mutate it freely.
+    """
+
+    def decorator(parse_func: Callable[[], T]) -> Callable[[], T]:
+        @functools.wraps(parse_func)
+        def wrapper() -> T:
+            if not enabled or input_is_stdin():
+                return parse_func()
+
+            input_hash = _hash_file(get_input_path(day))
+            parser_id = f"{parse_func.__module__}.{parse_func.__name__}-v{version}"
+            cache_file = CACHE_DIR.joinpath(f"{parser_id}-{input_hash[:32]}.pickle")
+
+            try:
+                with open(cache_file, "rb") as fp:
+                    result = pickle.load(fp)
+                os.utime(cache_file)  # Mark as recently used
+                return result
+            except Exception:
+                # Missing, truncated, or stale (e.g. a pickled class was renamed
+                # or moved without a version bump); just parse it again
+                pass
+
+            result = parse_func()
+
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as fp:
+                pickle.dump(result, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)  # Atomic, in case of parallel runs
+            _evict(MAX_CACHE_BYTES)
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,422 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Callable, Iterator
+import math
+from pathlib import Path
+import random
+import string
+
+
+_GENERATORS: dict[int, Callable[[float, random.Random], Iterator[str]]] = {}
+
+
+def _generator(day: int):
+    """Registers the decorated function as the input generator for `day`"""
+
+    def decorator(func: Callable[[float, random.Random], Iterator[str]]):
+        _GENERATORS[day] = func
+        return func
+
+    return decorator
+
+
+def _scaled(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def _scaled_side(base: int, scale: float) -> int:
+    return max(1, round(base * math.sqrt(scale)))
+
+
+@_generator(1)
+def _day1(scale: float, rng: random.Random):
+    depth = 100
+    for _ in range(_scaled(2000, scale)):
+        depth = max(1, depth + rng.randint(-10, 20))
+        yield str(depth)
+
+
+@_generator(2)
+def _day2(scale: float, rng: random.Random):
+    for _ in range(_scaled(1000, scale)):
+        yield f"{rng.choice(('forward', 'down', 'down', 'up'))} {rng.randint(1, 9)}"
+
+
+def _diagnostic_readings(
+    rng: random.Random, prefix: int, width: int, count: int
+) -> Iterator[int]:
+    """Yields `count` unique `width` bit readings below `prefix`, such that any
+    group of 2+ readings sharing a prefix splits on both bit values at the next
+    position (life support filtering assumes it never removes every candidate)
+    """
+    if count == 1:
+        yield (prefix << width) | rng.randrange(1 << width)
+        return
+
+    # Each half of the remaining bits can hold at most 2 ** (width - 1) readings
+    capacity = 1 << (width - 1)
+    num_zeros = rng.randint(max(1, count - capacity), min(count - 1, capacity))
+    yield from _diagnostic_readings(rng, prefix << 1, width - 1, num_zeros)
+    yield from _diagnostic_readings(rng, (prefix << 1) | 1, width - 1, count - num_zeros)
+
+
+@_generator(3)
+def _day3(scale: float, rng: random.Random):
+    num_readings = _scaled(1000, scale)
+    width = max(12, num_readings.bit_length() + 2)
+    readings = list(_diagnostic_readings(rng, 0, width, num_readings))
+    rng.shuffle(readings)
+    for reading in readings:
+        yield format(reading, f"0{width}b")
+
+
+@_generator(4)
+def _day4(scale: float, rng: random.Random):
+    draws = list(range(100))
+    rng.shuffle(draws)
+    yield ",".join(str(d) for d in draws)
+
+    for _ in range(_scaled(100, scale)):
+        yield ""
+        numbers = rng.sample(range(100), 25)
+        for i in range(0, 25, 5):
+            yield " ".join(f"{n:2}" for n in numbers[i : i + 5])
+
+
+@_generator(5)
+def _day5(scale: float, rng: random.Random):
+    size = _scaled_side(1000, scale)
+    for _ in range(_scaled(500, scale)):
+        # Lines are never a single point, as those can't be walked
+        length = rng.randint(1, max(1, size // 2))
+        dx, dy = rng.choice(((1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1)))
+        x1 = rng.randint(max(0, -dx * length), size - 1 - max(0, dx * length))
+        y1 = rng.randint(max(0, -dy * length), size - 1 - max(0, dy * length))
+        yield f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}"
+
+
+@_generator(6)
+def _day6(scale: float, rng: random.Random):
+    yield ",".join(str(rng.randint(1, 5)) for _ in range(_scaled(300, scale)))
+
+
+@_generator(7)
+def _day7(scale: float, rng: random.Random):
+    max_position = _scaled_side(2000, scale)
+    yield ",".join(
+        str(int(rng.triangular(0, max_position, max_position / 4)))
+        for _ in range(_scaled(1000, scale))
+    )
+
+
+_DIGIT_SEGMENTS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+@_generator(8)
+def _day8(scale: float, rng: random.Random):
+    for _ in range(_scaled(200, scale)):
+        wires = rng.sample("abcdefg", 7)
+        rewire = str.maketrans("abcdefg", "".join(wires))
+
+        def _scrambled(digit: int) -> str:
+            wiring = list(_DIGIT_SEGMENTS[digit].translate(rewire))
+            rng.shuffle(wiring)
+            return "".join(wiring)
+
+        patterns = [_scrambled(d) for d in rng.sample(range(10), 10)]
+        outputs = [_scrambled(rng.randrange(10)) for _ in range(4)]
+        yield f"{' '.join(patterns)} | {' '.join(outputs)}"
+
+
+@_generator(9)
+def _day9(scale: float, rng: random.Random):
+    # Real heightmaps are basins walled off by 9s, each with a single low point.
+    # Grow basins outwards from jittered seed points; the height is the distance
+    # from the seed, and cells bordering an earlier basin become walls.
+    side = _scaled_side(100, scale)
+    owner = [-1] * (side * side)
+    height = [0] * (side * side)
+
+    frontier: deque[int] = deque()
+    for row in range(3, side, 7):
+        for col in range(3, side, 7):
+            r = min(side - 1, row + rng.randint(-1, 1))
+            c = min(side - 1, col + rng.randint(-1, 1))
+            owner[r * side + c] = len(frontier)
+            frontier.append(r * side + c)
+
+    while frontier:
+        i = frontier.popleft()
+        row, col = divmod(i, side)
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < side and 0 <= c < side and owner[r * side + c] == -1:
+                owner[r * side + c] = owner[i]
+                height[r * side + c] = height[i] + 1
+                frontier.append(r * side + c)
+
+    for row in range(side):
+        line = []
+        for col in range(side):
+            i = row * side + col
+            is_wall = any(
+                0 <= r < side and 0 <= c < side and owner[r * side + c] < owner[i]
+                for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+            )
+            line.append("9" if is_wall else str(min(8, height[i])))
+        yield "".join(line)
+
+
+_CHUNK_PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@_generator(10)
+def _day10(scale: float, rng: random.Random):
+    for _ in range(_scaled(100, scale)):
+        line: list[str] = []
+        stack: list[str] = []
+        for _ in range(rng.randint(40, 110)):
+            if stack and rng.random() < 0.45:
+                line.append(_CHUNK_PAIRS[stack.pop()])
+            else:
+                stack.append(rng.choice("([{<"))
+                line.append(stack[-1])
+
+        if stack and rng.random() < 0.5:
+            # Corrupt the line with a closing character that doesn't match
+            wrong = [c for c in _CHUNK_PAIRS.values() if c != _CHUNK_PAIRS[stack[-1]]]
+            line.append(rng.choice(wrong))
+        elif not stack:
+            line.append("(")  # Keep the line incomplete
+
+        yield "".join(line)
+
+
+def _octopus_grid_syncs(grid: list[int], side: int, max_steps: int) -> bool:
+    """Simulates the octopus flashes on a flat `grid`, returning whether every
+    octopus flashes in the same step within `max_steps`
+    """
+    grid = list(grid)
+    for _ in range(max_steps):
+        grid = [g + 1 for g in grid]
+        to_flash = [i for i, g in enumerate(grid) if g > 9]
+        flashed = set(to_flash)
+        while to_flash:
+            row, col = divmod(to_flash.pop(), side)
+            for r in range(max(0, row - 1), min(side, row + 2)):
+                for c in range(max(0, col - 1), min(side, col + 2)):
+                    i = r * side + c
+                    grid[i] += 1
+                    if grid[i] > 9 and i not in flashed:
+                        flashed.add(i)
+                        to_flash.append(i)
+        if len(flashed) == len(grid):
+            return True
+        for i in flashed:
+            grid[i] = 0
+    return False
+
+
+@_generator(11)
+def _day11(scale: float, rng: random.Random):
+    # Random grids larger than 10x10 rarely synchronize (which part 2 needs),
+    # so larger grids tile a 10x10 block, retrying until the tiled grid syncs
+    tiles = max(1, round(math.sqrt(scale)))
+    side = 10 * tiles
+    while True:
+        block = [rng.randint(0, 9) for _ in range(100)]
+        grid = [block[(r % 10) * 10 + c % 10] for r in range(side) for c in range(side)]
+        if _octopus_grid_syncs(grid, side, max_steps=1000):
+            break
+
+    for r in range(side):
+        yield "".join(str(g) for g in grid[r * side : (r + 1) * side])
+
+
+@_generator(12)
+def _day12(scale: float, rng: random.Random):
+    # The number of paths grows exponentially with the number of caves,
+    # so caves are only added logarithmically with `scale`
+    extra = max(0, int(math.log2(scale)) // 2) if scale >= 1 else 0
+    names = rng.sample(
+        [a + b for a in string.ascii_lowercase for b in string.ascii_lowercase],
+        10 + extra,
+    )
+    small = names[: 6 + extra]
+    big = [n.upper() for n in names[6 + extra :]]
+
+    edges: set[tuple[str, ...]] = set()
+    for cave in big:
+        # Big caves never connect to each other, otherwise paths are infinite
+        for other in rng.sample(small + ["start", "end"], 3):
+            edges.add(tuple(sorted((cave, other))))
+    for cave in small:
+        for other in rng.sample(small + ["end"], 1):
+            if other != cave:
+                edges.add(tuple(sorted((cave, other))))
+    # Chain the small caves so there is always some path from start to end
+    for a, b in zip(["start"] + small, small + ["end"]):
+        edges.add(tuple(sorted((a, b))))
+
+    for a, b in edges:
+        yield f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}"
+
+
+@_generator(13)
+def _day13(scale: float, rng: random.Random):
+    # Each fold halves the paper exactly, down to a final 40x6 code area, so
+    # build the folds outwards from that area and then reverse them
+    num_folds = 4 + (max(0, round(math.log2(scale))) if scale >= 1 else 0)
+    width, height = 40, 6
+    folds: list[tuple[str, int]] = []
+    for i in range(num_folds):
+        if i % 2 == 0:
+            folds.append(("x", width))
+            width = width * 2 + 1
+        else:
+            folds.append(("y", height))
+            height = height * 2 + 1
+    folds.reverse()
+
+    fold_x = {p for a, p in folds if a == "x"}
+    fold_y = {p for a, p in folds if a == "y"}
+    dots: set[tuple[int, int]] = set()
+    target = min(_scaled(800, scale), (width * height) // 2)
+    while len(dots) < target:
+        x, y = rng.randrange(width), rng.randrange(height)
+        if x not in fold_x and y not in fold_y:
+            dots.add((x, y))
+
+    for x, y in dots:
+        yield f"{x},{y}"
+    yield ""
+    for axis, point in folds:
+        yield f"fold along {axis}={point}"
+
+
+@_generator(14)
+def _day14(scale: float, rng: random.Random):
+    elements = "BCFHKNOPSV"
+    yield "".join(rng.choices(elements, k=_scaled(20, scale)))
+    yield ""
+    for left in elements:
+        for right in elements:
+            yield f"{left}{right} -> {rng.choice(elements)}"
+
+
+@_generator(15)
+def _day15(scale: float, rng: random.Random):
+    side = _scaled_side(100, scale)
+    for _ in range(side):
+        yield "".join(rng.choices("123456789", k=side))
+
+
+def _encode_bits_packet(rng: random.Random, budget: int, depth: int) -> str:
+    """Builds a random BITS packet with roughly `budget` nested packets,
+    returned as a binary string
+    """
+    version = format(rng.randrange(8), "03b")
+
+    if budget <= 1 or depth <= 0:
+        value = format(rng.randrange(1 << rng.randint(1, 12)), "b")
+        value = value.zfill(-(-len(value) // 4) * 4)
+        groups = [value[i : i + 4] for i in range(0, len(value), 4)]
+        body = "".join(f"1{g}" for g in groups[:-1]) + f"0{groups[-1]}"
+        return f"{version}100{body}"
+
+    type_id = rng.choice((0, 0, 1, 2, 3, 5, 6, 7))
+    if type_id >= 5:
+        num_children = 2
+    elif rng.random() < 0.5:
+        num_children = 1  # Chains of single operands give deep nesting
+    else:
+        num_children = rng.randint(1, min(budget - 1, 8))
+
+    child_budget = max(1, (budget - 1) // num_children)
+    children = "".join(
+        _encode_bits_packet(rng, child_budget, depth - 1) for _ in range(num_children)
+    )
+
+    if len(children) < (1 << 15) and rng.random() < 0.5:
+        header = f"0{len(children):015b}"
+    else:
+        header = f"1{num_children:011b}"
+    return f"{version}{type_id:03b}{header}{children}"
+
+
+@_generator(16)
+def _day16(scale: float, rng: random.Random):
+    # Nesting depth is capped so the recursive packet parser stays within
+    # Python's recursion limit
+    depth = min(10 + round(math.log2(max(1.0, scale)) * 20), 300)
+    bits = _encode_bits_packet(rng, _scaled(250, scale), depth)
+    bits += "0" * (-len(bits) % 4)
+    yield "".join(f"{int(bits[i : i + 4], 2):X}" for i in range(0, len(bits), 4))
+
+
+@_generator(17)
+def _day17(scale: float, rng: random.Random):
+    x_min = _scaled_side(rng.randint(100, 200), scale)
+    x_max = x_min + _scaled_side(rng.randint(20, 60), scale)
+    y_min = -_scaled_side(rng.randint(80, 150), scale)
+    y_max = y_min + _scaled_side(rng.randint(20, 50), scale)
+    yield f"target area: x={x_min}..{x_max}, y={y_min}..{min(y_max, -1)}"
+
+
+def _snailfish_number(rng: random.Random, depth: int = 0) -> str:
+    """Builds an already reduced snailfish number (no pair nested inside four
+    pairs, and no regular number of 10 or more)
+    """
+    if depth > 0 and (depth == 4 or rng.random() < 0.35):
+        return str(rng.randint(0, 9))
+    return f"[{_snailfish_number(rng, depth + 1)},{_snailfish_number(rng, depth + 1)}]"
+
+
+@_generator(18)
+def _day18(scale: float, rng: random.Random):
+    for _ in range(_scaled(100, scale)):
+        yield _snailfish_number(rng)
+
+
+def available_days() -> list[int]:
+    return sorted(_GENERATORS)
+
+
+def generate_input(day: int, scale: float = 1.0, seed: int = 0) -> Iterator[str]:
+    """Yields the lines of a synthetic, valid input for advent `day`.
+
+    A `scale` of 1 produces inputs roughly the size of the real puzzle inputs.
+    The scale multiplies the number of input elements (readings, boards, grid
+    cells, ...), so grid sides grow with the square root of `scale`. The same
+    `seed` always produces the same input.
+    """
+    try:
+        generator = _GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"No input generator defined for day {day}")
+    return generator(scale, random.Random(f"{day}-{seed}"))
+
+
+def write_input(day: int, out_dir: str | Path, scale: float = 1.0, seed: int = 0) -> Path:
+    """Writes a synthetic input for `day` to `out_dir/day{day}.txt`, in the same
+    layout as `data/`, so it can be loaded by pointing `get_question_input` at
+    `out_dir` (see `libraries.questions.set_input_dir`)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    filename = out_dir.joinpath(f"day{day}.txt")
+    with open(filename, "w") as fp:
+        for line in generate_input(day, scale, seed):
+            fp.write(line)
+            fp.write("\n")
+    return filename
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import contextlib
+import io
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+import time
+import traceback
+from libraries.benchmark import discover_days, discover_parts
+from libraries.print_util import make_bold, make_gray, make_red
+from libraries.questions import get_answer_module
+
+
+@dataclass
+class PartRun:
+    """Outcome of running a single `part_N` function in a worker process"""
+
+    day: int
+    part: int
+    output: str = ""
+    elapsed_ms: float | None = None
+    error: str | None = None
+
+
+def _run_part_worker(day: int, part: int, conn: Connection):
+    """Worker process entrypoint; runs `part` of `day` and sends back its
+    captured output and execution time
+    """
+    run = PartRun(day, part)
+    buffer = io.StringIO()
+    try:
+        func = discover_parts(get_answer_module(str(day)))[part]
+        with contextlib.redirect_stdout(buffer):
+            start = time.perf_counter()
+            func()
+            end = time.perf_counter()
+        run.elapsed_ms = (end - start) * 1000
+    except BaseException:
+        run.error = traceback.format_exc(limit=3)
+    run.output = buffer.getvalue()
+    conn.send(run)
+    conn.close()
+
+
+def list_all_parts() -> list[tuple[int, int]]:
+    """Returns every (day, part) pair defined under `solutions/`, in order"""
+    return [
+        (day, part)
+        for day in discover_days()
+        for part in discover_parts(get_answer_module(str(day)))
+    ]
+
+
+def run_all(jobs: int | None = None, timeout: float | None = None) -> list[PartRun]:
+    """Runs every (day, part) pair across up to `jobs` worker processes
+    (defaults to the CPU count). Any part still running after `timeout`
+    seconds is terminated and reported as timed out.
+
+    Results are returned in (day, part) order, regardless of completion order.
+    """
+    jobs = jobs or multiprocessing.cpu_count()
+    pending = list_all_parts()
+    pending.reverse()  # Popped from the end, so keep day 1 first
+
+    runs: dict[tuple[int, int], PartRun] = {}
+    # Receiving end of each worker's pipe -> (process, (day, part), deadline)
+    active: dict[Connection, tuple[multiprocessing.Process, tuple[int, int], float]]
+    active = {}
+
+    while pending or active:
+        while pending and len(active) < jobs:
+            day, part = pending.pop()
+            recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+            proc = multiprocessing.Process(
+                target=_run_part_worker, args=(day, part, send_conn), daemon=True
+            )
+            proc.start()
+            send_conn.close()  # Only the worker should hold the sending end
+            deadline = time.monotonic() + timeout if timeout else float("inf")
+            active[recv_conn] = (proc, (day, part), deadline)
+
+        next_deadline = min(d for _, _, d in active.values())
+        wait_for = None
+        if next_deadline != float("inf"):
+            wait_for = max(0.0, next_deadline - time.monotonic())
+        ready = wait(list(active), timeout=wait_for)
+
+        for conn in ready:
+            proc, key, _ = active.pop(conn)
+            try:
+                runs[key] = conn.recv()
+            except EOFError:
+                runs[key] = PartRun(*key, error="Worker exited without a result")
+            conn.close()
+            proc.join()
+
+        now = time.monotonic()
+        for conn, (proc, key, deadline) in list(active.items()):
+            if now >= deadline:
+                proc.terminate()
+                proc.join()
+                conn.close()
+                del active[conn]
+                runs[key] = PartRun(*key, error=f"Timed out after {timeout}s")
+
+    return [runs[key] for key in sorted(runs)]
+
+
+def print_runs(runs: list[PartRun]):
+    for run in runs:
+        print(make_bold(f"Day {run.day} part {run.part}"))
+        if run.output:
+            print(run.output.rstrip("\n"))
+        if run.error:
+            print(make_red(run.error.rstrip("\n")))
+        else:
+            print(make_gray(f"Execution time: {run.elapsed_ms:3f} ms"))
+        print(make_gray("-" * 29))
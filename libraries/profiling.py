@@ -0,0 +1,177 @@
+from __future__ import annotations
+from collections.abc import Callable
+import cProfile
+from dataclasses import dataclass
+from pathlib import Path
+import pstats
+import resource
+import sys
+import sysconfig
+import tracemalloc
+from typing import NamedTuple
+from libraries.print_util import make_bold, make_gray
+
+
+def profile_call(func: Callable) -> cProfile.Profile:
+    """Calls `func` under a deterministic profiler, returning the profiler"""
+    profiler = cProfile.Profile()
+    profiler.runcall(func)
+    return profiler
+
+
+def print_profile_report(
+    profiler: cProfile.Profile, top: int = 20, out_file: str | Path | None = None
+):
+    """Prints the `top` functions by cumulative time and by self time.
+
+    If `out_file` is given, the raw stats are also written there in `.pstats`
+    format (loadable with `pstats`, snakeviz, or flameprof for flamegraphs).
+    """
+    stats = pstats.Stats(profiler)
+    stats.strip_dirs()
+
+    for sort_key, title in (
+        (pstats.SortKey.CUMULATIVE, "cumulative time"),
+        (pstats.SortKey.TIME, "self time"),
+    ):
+        print(make_bold(f"Top {top} functions by {title}:"))
+        stats.sort_stats(sort_key).print_stats(top)
+
+    if out_file:
+        profiler.dump_stats(out_file)
+        print(make_gray(f"Profile stats written to {out_file}"))
+
+
+class AllocationSite(NamedTuple):
+    filename: str
+    lineno: int
+    size: int  # Bytes held by allocations made from this line
+    count: int  # Number of memory blocks held
+
+
+@dataclass
+class MemoryReport:
+    """Memory usage of a single call, as measured by `memory_profile_call`"""
+
+    peak_traced_bytes: int
+    peak_rss_bytes: int  # Peak over the whole process lifetime, not just the call
+    snapshot_traced_bytes: int  # Traced memory when `top_sites` was snapshotted
+    top_sites: list[AllocationSite]
+
+
+def _peak_rss_bytes() -> int:
+    # `ru_maxrss` is in kilobytes on Linux, but bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+# Traced memory has to grow by this factor past the last snapshot to take
+# another, so steadily growing calls don't snapshot on every return
+_SNAPSHOT_GROWTH = 1.1
+
+# Frames kept per allocation, enough to find the solution line behind an
+# allocation made deep inside the standard library or `libraries/`
+_TRACE_FRAMES = 32
+
+_STDLIB_DIR = sysconfig.get_paths()["stdlib"]
+_SITE_PACKAGES_DIR = sysconfig.get_paths()["purelib"]
+_LIBRARIES_DIR = str(Path(__file__).parent)
+
+
+def _is_user_frame(frame: tracemalloc.Frame) -> bool:
+    filename = frame.filename
+    if filename.startswith("<"):  # e.g. <frozen importlib._bootstrap>
+        return False
+    if filename.startswith(_SITE_PACKAGES_DIR):
+        return True
+    return not filename.startswith((_STDLIB_DIR, _LIBRARIES_DIR))
+
+
+def _top_user_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[AllocationSite]:
+    """Groups the traced memory by the innermost frame outside the standard
+    library and `libraries/`, i.e. the solution line that caused it
+    """
+    sites: dict[tuple[str, int], list[int]] = {}
+    for trace in snapshot.traces:
+        # Frames run from the oldest call to the most recent one
+        frame = next(
+            (frame for frame in reversed(trace.traceback) if _is_user_frame(frame)),
+            None,
+        )
+        if frame is None:
+            continue
+        site = sites.setdefault((frame.filename, frame.lineno), [0, 0])
+        site[0] += trace.size
+        site[1] += 1
+
+    top_sites = [
+        AllocationSite(filename, lineno, size, count)
+        for (filename, lineno), (size, count) in sites.items()
+    ]
+    top_sites.sort(key=lambda site: site.size, reverse=True)
+    return top_sites[:top]
+
+
+def memory_profile_call(func: Callable, top: int = 10) -> MemoryReport:
+    """Calls `func` with allocation tracing enabled.
+
+    Allocation sites are snapshotted whenever a function (Python or C) returns
+    with traced memory at a new high, while the caller's locals are still alive,
+    so the reported sites are those holding memory around the peak, even when
+    the helpers which allocated it have freed everything by the time `func`
+    ends. Each site is the solution line behind the allocation.
+    """
+    snapshot: tracemalloc.Snapshot | None = None
+    snapshot_bytes = 0
+
+    def _snapshot_at_high(frame, event, _):
+        nonlocal snapshot, snapshot_bytes
+        if event != "return" and event != "c_return":
+            return
+        current_traced, _ = tracemalloc.get_traced_memory()
+        if current_traced > snapshot_bytes * _SNAPSHOT_GROWTH:
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_bytes = current_traced
+
+    tracemalloc.start(_TRACE_FRAMES)
+    sys.setprofile(_snapshot_at_high)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+        _, peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    top_sites = [] if snapshot is None else _top_user_sites(snapshot, top)
+
+    return MemoryReport(peak_traced, _peak_rss_bytes(), snapshot_bytes, top_sites)
+
+
+def _format_bytes(num_bytes: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
+
+
+def print_memory_report(report: MemoryReport):
+    print(make_bold(f"Peak traced memory: {_format_bytes(report.peak_traced_bytes)}"))
+    print(
+        make_bold(
+            "Peak process RSS (whole process lifetime): "
+            f"{_format_bytes(report.peak_rss_bytes)}"
+        )
+    )
+    if report.top_sites:
+        print(
+            make_bold(
+                "Top allocation sites at the traced memory high "
+                f"({_format_bytes(report.snapshot_traced_bytes)}):"
+            )
+        )
+        for site in report.top_sites:
+            print(
+                f"  {site.filename}:{site.lineno}: "
+                f"{_format_bytes(site.size)} in {site.count} blocks"
+            )
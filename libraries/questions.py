@@ -1,5 +1,9 @@
+from __future__ import annotations
 from pathlib import Path
 from collections.abc import Generator
+from typing import BinaryIO
+from functools import cached_property, partial
+import mmap
 import sys
 from types import ModuleType
 import importlib
@@ -8,15 +12,128 @@ import time
 from libraries.print_util import make_gray, make_red
 
 
+_input_dir = Path(__file__).resolve().parents[1].joinpath("data")
+# Overrides `_input_dir` for every day when set; "-" reads from stdin
+_input_file: str | None = None
+
+_STREAM_CHUNK_BYTES = 1 << 16
+
+
+def get_input_dir() -> Path:
+    return _input_dir
+
+
+def set_input_dir(input_dir: str | Path):
+    """Read inputs from `input_dir/dayN.txt` instead of the packaged `data/` files"""
+    global _input_dir
+    _input_dir = Path(input_dir).resolve()
+
+
+def set_input_file(input_file: str | Path | None):
+    """Read the input for every day from `input_file` instead of `dayN.txt`.
+    Pass "-" to stream the input from stdin, or None to clear the override.
+    """
+    global _input_file
+    _input_file = str(input_file) if input_file is not None else None
+
+
+def input_is_stdin() -> bool:
+    return _input_file == "-"
+
+
+def get_input_path(day: int) -> Path:
+    if input_is_stdin():
+        raise ValueError("Input is being streamed from stdin, and has no path")
+    if _input_file is not None:
+        return Path(_input_file).resolve()
+    return _input_dir.joinpath(f"day{day}.txt").resolve()
+
+
+def _stream_lines(fp: BinaryIO) -> Generator[str, None, None]:
+    """Yields stripped lines from `fp`, reading it in fixed size chunks so
+    memory use stays bounded no matter how large the input is
+    """
+    remainder = b""
+    while chunk := fp.read(_STREAM_CHUNK_BYTES):
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()  # Last line may continue in the next chunk
+        for line in lines:
+            yield line.decode().strip()
+    if remainder:
+        yield remainder.decode().strip()
+
+
 def get_question_input(day: int) -> Generator[str, None, None]:
     """Get the input data for the given advent `day`"""
 
-    filename = (
-        Path(__file__).resolve().parents[1].joinpath(f"data/day{day}.txt").resolve()
-    )
-    with open(filename) as fp:
-        for line in fp:
-            yield line.strip()
+    if input_is_stdin():
+        yield from _stream_lines(sys.stdin.buffer)
+        return
+
+    with open(get_input_path(day), "rb") as fp:
+        yield from _stream_lines(fp)
+
+
+class QuestionInput:
+    """Whole-file view of an advent day's input, backed by a memory map.
+
+    `raw` exposes the file bytes without copying, for parsers that slice
+    the data themselves; `lines` gives the same stripped lines that
+    `get_question_input` yields, split in a single pass.
+    """
+
+    def __init__(self, source: Path | bytes) -> None:
+        self._mmap: mmap.mmap | None = None
+        self._data = b""
+        self._raw: memoryview | None = None
+
+        if isinstance(source, bytes):
+            self._data = source  # Already in memory (e.g. read from stdin)
+            return
+
+        with open(source, "rb") as fp:
+            # Empty files cannot be memory-mapped
+            if fp.seek(0, 2) > 0:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def raw(self) -> memoryview:
+        """Zero-copy view over the raw file bytes"""
+        if self._raw is None:
+            self._raw = memoryview(self._mmap if self._mmap is not None else self._data)
+        return self._raw
+
+    @cached_property
+    def text(self) -> str:
+        return self.raw.tobytes().decode()
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return list(map(str.strip, self.text.splitlines()))
+
+    def close(self):
+        if self._raw is not None:
+            self._raw.release()
+            self._raw = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Slices of `raw` are still alive; the map closes once they're freed
+            self._mmap = None
+
+    def __enter__(self) -> QuestionInput:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def load_question_input(day: int) -> QuestionInput:
+    """Load the whole input file for the given advent `day` in one pass"""
+    if input_is_stdin():
+        return QuestionInput(sys.stdin.buffer.read())
+    return QuestionInput(get_input_path(day))
 
 
 def get_answer_module(day: str) -> ModuleType:
@@ -26,7 +143,15 @@ def get_answer_module(day: str) -> ModuleType:
         sys.exit(make_red(f"No module `solutions.day{day}.py` found"))
 
 
-def run_answer(answer_module: ModuleType, part: str):
+def run_answer(
+    answer_module: ModuleType,
+    part: str,
+    profile: bool = False,
+    profile_top: int = 20,
+    profile_out: str | None = None,
+    memory: bool = False,
+    jobs: int | None = None,
+):
     funcs = inspect.getmembers(answer_module, inspect.isfunction)
 
     try:
@@ -34,12 +159,47 @@ def run_answer(answer_module: ModuleType, part: str):
     except StopIteration:
         sys.exit(make_red(f"No function `part_{part}` defined in target module"))
 
+    if jobs is not None:
+        # Only parts which can split their work take a `jobs` argument
+        if "jobs" not in inspect.signature(target_func).parameters:
+            sys.exit(make_red(f"`part_{part}` does not support running with --jobs"))
+        target_func = partial(target_func, jobs=jobs)
+
     print(make_gray("-" * 6 + " SOLUTION OUTPUT " + "-" * 6 + "\033[0m"))
 
+    profiler = None
+    memory_report = None
     start = time.perf_counter()
-    target_func()
+    if profile:
+        from libraries.profiling import profile_call
+
+        profiler = profile_call(target_func)
+    elif memory:
+        from libraries import input_cache
+        from libraries.profiling import memory_profile_call
+
+        # Parsing is part of the part's memory use, so don't load a cached parse
+        cache_enabled, input_cache.enabled = input_cache.enabled, False
+        try:
+            memory_report = memory_profile_call(target_func)
+        finally:
+            input_cache.enabled = cache_enabled
+    else:
+        target_func()
     end = time.perf_counter()
 
     print(make_gray("-" * 29))
     print(make_gray(f"Execution time: {(end - start)*1000:3f} ms"))
     print(make_gray("-" * 29))
+
+    if profiler:
+        from libraries.profiling import print_profile_report
+
+        print(make_gray("(Execution time includes profiler overhead)"))
+        print_profile_report(profiler, profile_top, profile_out)
+
+    if memory_report:
+        from libraries.profiling import print_memory_report
+
+        print(make_gray("(Execution time includes allocation tracing overhead)"))
+        print_memory_report(memory_report)
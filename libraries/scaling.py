@@ -0,0 +1,150 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+import json
+import math
+from pathlib import Path
+import tempfile
+from libraries import input_cache, input_generators
+from libraries.benchmark import discover_parts, time_part
+from libraries.print_util import make_bold, make_gray
+from libraries.questions import get_answer_module, get_input_dir, set_input_dir
+
+
+# Upper bounds on the fitted exponent for each complexity class label
+_COMPLEXITY_CLASSES = [
+    (0.3, "O(1)"),
+    (1.1, "O(n)"),
+    (1.3, "O(n log n)"),
+    (1.75, "O(n^1.5)"),
+    (2.5, "O(n^2)"),
+    (3.5, "O(n^3)"),
+]
+
+
+@dataclass
+class ScalingPoint:
+    scale: float
+    input_bytes: int
+    time_ms: float
+
+
+@dataclass
+class ScalingResult:
+    """Run time of a `part_N` function across increasing input sizes"""
+
+    name: str
+    points: list[ScalingPoint]
+    exponent: float | None
+    complexity: str
+
+
+def fit_exponent(points: list[ScalingPoint]) -> float | None:
+    """Least squares fit of the slope of log(time) against log(input size)"""
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(p.input_bytes) for p in points]
+    ys = [math.log(max(p.time_ms, 1e-6)) for p in points]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if variance == 0:
+        return None
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+
+def classify(exponent: float | None) -> str:
+    if exponent is None:
+        return "unknown"
+    return next(
+        (label for bound, label in _COMPLEXITY_CLASSES if exponent < bound),
+        "worse than O(n^3)",
+    )
+
+
+def run_scaling(
+    days: list[int] | None = None,
+    parts: list[int] | None = None,
+    max_scale: float = 64,
+    min_scale: float = 0.25,
+    repeats: int = 3,
+    seed: int = 0,
+    time_budget_ms: float = 5000,
+) -> list[ScalingResult]:
+    """Times every requested part on synthetic inputs, doubling the scale from
+    `min_scale` up to `max_scale`, and fits the time-vs-size exponent.
+
+    A part stops being scaled up once a single run takes over `time_budget_ms`.
+    The parsed input cache is bypassed so parsing is timed at every size.
+    """
+    days = days or input_generators.available_days()
+    scales = []
+    scale = min_scale
+    while scale <= max_scale:
+        scales.append(scale)
+        scale *= 2
+
+    original_input_dir = get_input_dir()
+    original_cache_enabled = input_cache.enabled
+    input_cache.enabled = False
+    results: list[ScalingResult] = []
+
+    try:
+        for day in days:
+            answer_parts = discover_parts(get_answer_module(str(day)))
+            points: dict[int, list[ScalingPoint]] = {
+                part: [] for part in answer_parts if not parts or part in parts
+            }
+            over_budget: set[int] = set()
+
+            for scale in scales:
+                if over_budget == set(points):
+                    break
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    filename = input_generators.write_input(day, tmp_dir, scale, seed)
+                    set_input_dir(tmp_dir)
+
+                    for part in points:
+                        if part in over_budget:
+                            continue
+                        print(
+                            make_gray(f"Scaling day {day} part {part} at x{scale}..."),
+                            flush=True,
+                        )
+                        time_ms = min(time_part(answer_parts[part], 0, repeats))
+                        size = filename.stat().st_size
+                        points[part].append(ScalingPoint(scale, size, time_ms))
+                        if time_ms > time_budget_ms:
+                            over_budget.add(part)
+
+            for part, part_points in points.items():
+                exponent = fit_exponent(part_points)
+                results.append(
+                    ScalingResult(
+                        name=f"solutions.day{day}.part_{part}",
+                        points=part_points,
+                        exponent=exponent,
+                        complexity=classify(exponent),
+                    )
+                )
+    finally:
+        set_input_dir(original_input_dir)
+        input_cache.enabled = original_cache_enabled
+
+    return results
+
+
+def print_scaling_report(results: list[ScalingResult]):
+    header = f"{'part':<24} {'sizes':>6} {'exponent':>9}  complexity"
+    print(make_bold(header))
+    print(make_gray("-" * len(header)))
+    for r in results:
+        exponent = f"{r.exponent:.2f}" if r.exponent is not None else "-"
+        print(f"{r.name:<24} {len(r.points):>6} {exponent:>9}  ~{r.complexity}")
+
+
+def write_scaling_json(results: list[ScalingResult], path: str | Path):
+    with open(path, "w") as fp:
+        json.dump({"results": [asdict(r) for r in results]}, fp, indent=2)
@@ -1,5 +1,12 @@
-from libraries.questions import get_answer_module, run_answer
+from libraries.print_util import make_gray, make_red
+from libraries.questions import (
+    get_answer_module,
+    run_answer,
+    set_input_dir,
+    set_input_file,
+)
 import argparse
+import sys
 
 
 def main():
@@ -19,15 +26,240 @@ def main():
         type=int,
         default=None,
     )
+    parser.add_argument(
+        "--bench",
+        help="Benchmark every day/part (or only --day/--part if given) instead of running once",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--warmup",
+        help="Number of untimed runs per part before benchmarking",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--repeats",
+        help="Number of timed runs per part when benchmarking",
+        type=int,
+        default=5,
+    )
+    parser.add_argument(
+        "--bench-json",
+        help="Path to write benchmark results to as JSON",
+        default=None,
+    )
+    parser.add_argument(
+        "--baseline",
+        help="Benchmark results JSON to compare against; exits non-zero on regressions",
+        default=None,
+    )
+    parser.add_argument(
+        "--threshold",
+        help="Percent slowdown over the baseline median that counts as a regression",
+        type=float,
+        default=10.0,
+    )
+    parser.add_argument(
+        "--all",
+        help="Run every day/part across a pool of worker processes",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--jobs",
+        help="Number of worker processes for --all (defaults to the CPU count), or "
+        "for a single part which supports it, e.g. --day 2 --part 1 --jobs 4",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--timeout",
+        help="Seconds each part may run for under --all before being terminated",
+        type=float,
+        default=None,
+    )
+    parser.add_argument(
+        "--no-cache",
+        help="Always re-parse inputs instead of loading cached parsed inputs",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile",
+        help="Run the part under cProfile and report its hottest functions",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile-top",
+        help="Number of functions to list in the profile report",
+        type=int,
+        default=20,
+    )
+    parser.add_argument(
+        "--profile-out",
+        help="Path to write the raw profile to in .pstats format",
+        default=None,
+    )
+    parser.add_argument(
+        "--memory",
+        help="Report peak traced memory, peak RSS and top allocation sites for the part",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--input-dir",
+        help="Directory to read dayN.txt inputs from instead of data/",
+        default=None,
+    )
+    parser.add_argument(
+        "--input",
+        help="Read the day's input from this file instead of data/; use - for stdin",
+        default=None,
+    )
+    parser.add_argument(
+        "--generate",
+        help="Write synthetic inputs for every day (or only --day) into this directory",
+        default=None,
+    )
+    parser.add_argument(
+        "--scale",
+        help="Input size multiplier for --generate; 1 is roughly the real input size",
+        type=float,
+        default=1.0,
+    )
+    parser.add_argument(
+        "--seed",
+        help="Random seed for --generate",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--scaling",
+        help="Time every day/part (or only --day/--part) on synthetic inputs of doubling "
+        "size, and fit how run time grows with input size",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--max-scale",
+        help="Largest input scale to try with --scaling",
+        type=float,
+        default=64,
+    )
+    parser.add_argument(
+        "--scaling-json",
+        help="Path to write the raw --scaling curves to as JSON",
+        default=None,
+    )
     args = parser.parse_args()
 
     # Code start
 
+    if args.generate:
+        from libraries import input_generators
+
+        for gen_day in [args.day] if args.day else input_generators.available_days():
+            filename = input_generators.write_input(
+                gen_day, args.generate, args.scale, args.seed
+            )
+            print(make_gray(f"Generated {filename}"))
+        return
+
+    if args.input:
+        # A single input file only makes sense for a single day, and stdin can
+        # only be read once, so can't feed repeated or multiple runs
+        if args.scaling or args.all:
+            sys.exit(make_red("--input can't be used with --scaling or --all"))
+        if args.bench and not args.day:
+            sys.exit(make_red("--input with --bench needs a --day"))
+        if args.input == "-" and args.bench:
+            sys.exit(make_red("--input - can't be used with --bench; use a file"))
+        if args.input == "-" and not (args.day and args.part):
+            sys.exit(make_red("--input - needs --day and --part, as stdin is the input"))
+
+    if args.profile or args.memory:
+        # Each instruments a single run of one part, and only one at a time
+        if args.profile and args.memory:
+            sys.exit(make_red("--profile and --memory can't be used together"))
+        if args.bench or args.all or args.scaling:
+            sys.exit(
+                make_red(
+                    "--profile and --memory can't be used with --bench, --all or --scaling"
+                )
+            )
+
+    if args.input_dir:
+        set_input_dir(args.input_dir)
+    if args.input:
+        set_input_file(args.input)
+
+    if args.scaling:
+        from libraries import scaling
+
+        results = scaling.run_scaling(
+            days=[args.day] if args.day else None,
+            parts=[args.part] if args.part else None,
+            max_scale=args.max_scale,
+            repeats=args.repeats,
+            seed=args.seed,
+        )
+        scaling.print_scaling_report(results)
+        if args.scaling_json:
+            scaling.write_scaling_json(results, args.scaling_json)
+        return
+
+    if args.no_cache:
+        from libraries import input_cache
+
+        input_cache.enabled = False
+
+    if args.bench:
+        from libraries import benchmark
+
+        results = benchmark.run_benchmarks(
+            days=[args.day] if args.day else None,
+            parts=[args.part] if args.part else None,
+            warmup=args.warmup,
+            repeats=args.repeats,
+        )
+        benchmark.print_report(results)
+        if args.bench_json:
+            benchmark.write_json(results, args.bench_json)
+        if args.baseline:
+            comparisons = benchmark.compare_to_baseline(
+                results, benchmark.load_json(args.baseline), args.threshold
+            )
+            print()
+            benchmark.print_comparison(comparisons)
+            if any(c.regressed for c in comparisons):
+                sys.exit(make_red("Benchmark regressions found against baseline"))
+            if any(c.underpowered for c in comparisons):
+                sys.exit(
+                    make_red(
+                        "Too few samples to detect regressions; "
+                        "use at least 3 repeats here and in the baseline"
+                    )
+                )
+        return
+
+    if args.all:
+        from libraries import parallel
+
+        runs = parallel.run_all(jobs=args.jobs, timeout=args.timeout)
+        parallel.print_runs(runs)
+        if any(r.error for r in runs):
+            sys.exit(make_red("Some parts failed or timed out"))
+        return
+
     day = args.day or input("Enter the day # to run code for: ")
     answer_mod = get_answer_module(day)
 
     part = args.part or input("Enter the question part # to execute: ")
-    run_answer(answer_mod, part)
+    run_answer(
+        answer_mod,
+        part,
+        args.profile,
+        args.profile_top,
+        args.profile_out,
+        args.memory,
+        args.jobs,
+    )
 
 
 if __name__ == "__main__":
@@ -1,26 +1,69 @@
-from libraries.questions import get_question_input
+from array import array
+from collections.abc import Iterable
+from operator import gt
+import re
+from libraries.input_cache import cached_parse
+from libraries.questions import get_question_input, input_is_stdin, load_question_input
 
 
-def part_1():
-    inputs = get_question_input(1)
-    prev = int(next(inputs))
-    num_increases = 0
-    for depth in inputs:
-        if int(depth) > prev:
-            num_increases += 1
-        prev = int(depth)
-    print(num_increases)
+def count_window_increases(
+    depths: Iterable[int], window_sizes: Iterable[int]
+) -> dict[int, int]:
+    """Counts how many times the sum of a sliding window of depths increases,
+    for each of the given `window_sizes`, in a single pass over `depths`.
 
+    Consecutive windows of size k share all but one reading, so the sum increases
+    exactly when the reading entering the window is larger than the one leaving it.
+    Only the last max(k) readings are kept, in a ring buffer, so each reading
+    costs O(1) per window size and memory stays constant for any stream length.
+    """
+    window_sizes = sorted(set(window_sizes))
+    if window_sizes and window_sizes[0] < 1:
+        raise ValueError(f"Window sizes must be at least 1, not {window_sizes[0]}")
+    increases = {k: 0 for k in window_sizes}
+    if not window_sizes:
+        return increases
 
-def part_2():
-    inputs = get_question_input(1)
-    window = [int(next(inputs)) for i in range(3)]
-    num_increases = 0
+    ring_size = window_sizes[-1]
+    ring = [0] * ring_size
+
+    for i, depth in enumerate(depths):
+        for k in window_sizes:
+            if k > i:
+                break  # Not enough readings yet for this (or any larger) window
+            if depth > ring[(i - k) % ring_size]:
+                increases[k] += 1
+        ring[i % ring_size] = depth
+
+    return increases
+
+
+@cached_parse(1)
+def _load_depths() -> array:
+    """Parses every depth reading into a compact integer array in one bulk pass"""
+    with load_question_input(1) as question_input:
+        return array("q", map(int, re.findall(rb"-?\d+", question_input.raw)))
 
-    for depth in inputs:
-        window.append(int(depth))
-        if window[-1] > window[0]:
-            num_increases += 1
-        window.pop(0)
 
-    print(num_increases)
+def count_increases_bulk(depths: array, window_size: int) -> int:
+    """Counts window sum increases by comparing `depths` against itself, lagged"""
+    if window_size < 1:
+        raise ValueError(f"Window sizes must be at least 1, not {window_size}")
+    return sum(map(gt, depths[window_size:], depths))
+
+
+def part_1():
+    if input_is_stdin():
+        # Piped input may not fit in memory, so stream it instead
+        depths = map(int, get_question_input(1))
+        print(count_window_increases(depths, [1])[1])
+    else:
+        print(count_increases_bulk(_load_depths(), 1))
+
+
+def part_2():
+    if input_is_stdin():
+        depths = map(int, get_question_input(1))
+        print(count_window_increases(depths, [3])[3])
+    else:
+        print(count_increases_bulk(_load_depths(), 3))
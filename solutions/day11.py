@@ -1,5 +1,6 @@
 import sys
 from typing import Callable
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 from libraries.print_util import make_red
 
@@ -65,18 +66,26 @@ def __simulate_step(octo_map: list[list[int]]):
     return octo_map, flashed
 
 
-def part_1():
+@cached_parse(11)
+def __parse_octopus_map() -> list[list[int]]:
     data = get_question_input(11)
     octopuses: list[list[int]] = [[int(h) for h in next(data)]]
     map_w = len(octopuses[0])
 
-    num_flashes = 0
-
     for line in data:
         if len(line) != map_w:
             sys.exit(make_red("Octopus map data does not have constant width"))
         octopuses.append([int(h) for h in line])
 
+    return octopuses
+
+
+def part_1():
+    octopuses = __parse_octopus_map()
+    map_w = len(octopuses[0])
+
+    num_flashes = 0
+
     # Simulating 100 steps
     for _ in range(100):
         octopuses, flashed_octopuses = __simulate_step(octopuses)
@@ -86,15 +95,9 @@ def part_1():
 
 
 def part_2():
-    data = get_question_input(11)
-    octopuses: list[list[int]] = [[int(h) for h in next(data)]]
+    octopuses = __parse_octopus_map()
     map_w = len(octopuses[0])
 
-    for line in data:
-        if len(line) != map_w:
-            sys.exit(make_red("Octopus map data does not have constant width"))
-        octopuses.append([int(h) for h in line])
-
     num_octopuses = map_w * len(octopuses)
     flashed_octopuses: set[tuple[int, int]] = set()
     step = 0
@@ -1,3 +1,4 @@
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
@@ -45,12 +46,18 @@ def __navigate_caves(
     return found_paths
 
 
-def part_1():
+@cached_parse(12)
+def __parse_connections() -> dict[str, list[str]]:
     connections: dict[str, list[str]] = {}
     for connection_str in get_question_input(12):
         cave_a, cave_b = connection_str.split("-")
         connections.setdefault(cave_a, []).append(cave_b)
         connections.setdefault(cave_b, []).append(cave_a)
+    return connections
+
+
+def part_1():
+    connections = __parse_connections()
 
     all_paths = __navigate_caves(
         node="start",
@@ -62,11 +69,7 @@ def part_1():
 
 
 def part_2():
-    connections: dict[str, list[str]] = {}
-    for connection_str in get_question_input(12):
-        cave_a, cave_b = connection_str.split("-")
-        connections.setdefault(cave_a, []).append(cave_b)
-        connections.setdefault(cave_b, []).append(cave_a)
+    connections = __parse_connections()
 
     all_paths = __navigate_caves(
         node="start",
@@ -1,3 +1,4 @@
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
@@ -33,7 +34,9 @@ def __print_dots(dots: set[tuple[int, int]]):
     print(output)
 
 
-def part_1():
+@cached_parse(13)
+def __parse_manual() -> tuple[set[tuple[int, int]], list[tuple[str, int]]]:
+    """Parses the dots, then the (direction, point) of each fold"""
     data = get_question_input(13)
     dots: set[tuple[int, int]] = set()
 
@@ -41,22 +44,21 @@ def part_1():
         x, y = (int(n) for n in line.split(","))
         dots.add((x, y))
 
-    fold_dir, fold_point = __parse_fold_data(next(data))
+    folds = [__parse_fold_data(line) for line in data]
+    return dots, folds
+
+
+def part_1():
+    dots, folds = __parse_manual()
+    fold_dir, fold_point = folds[0]
 
     folded_dots = __perform_fold(fold_dir, fold_point, dots)
     print(len(folded_dots))
 
 
 def part_2():
-    data = get_question_input(13)
-    dots: set[tuple[int, int]] = set()
-
-    while line := next(data):
-        x, y = (int(n) for n in line.split(","))
-        dots.add((x, y))
-
-    while (line := next(data, None)) is not None:
-        fold_dir, fold_point = __parse_fold_data(line)
+    dots, folds = __parse_manual()
+    for fold_dir, fold_point in folds:
         dots = __perform_fold(fold_dir, fold_point, dots)
 
     __print_dots(dots)
@@ -1,5 +1,6 @@
 from collections import Counter
 from itertools import pairwise
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
@@ -25,7 +26,9 @@ def __get_mutation_step_outcome(
     return new_pairs
 
 
-def part_1(num_steps=10):
+@cached_parse(14)
+def __parse_polymer_rules() -> tuple[list[str], dict[str, str]]:
+    """Parses the initial polymer and the pair insertion rules"""
     data = get_question_input(14)
     init_polymer = [c for c in next(data)]
     next(data)  # Skip empty line
@@ -35,6 +38,12 @@ def part_1(num_steps=10):
         pair, value = rule.split(" -> ")
         insertion_rules[pair] = value
 
+    return init_polymer, insertion_rules
+
+
+def part_1(num_steps=10):
+    init_polymer, insertion_rules = __parse_polymer_rules()
+
     # Will track the count of paired elements in a polymer
     # Using `Counter` here to properly count occurrences of each pair in the initial polymer
     polymer_pairs = dict(
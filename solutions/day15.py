@@ -1,5 +1,6 @@
 from copy import deepcopy
 import sys
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 from libraries.print_util import make_red
 
@@ -59,7 +60,8 @@ def __find_min_risk_total(risk_map: list[list[int]]):
     sys.exit(make_red(f"Failed to find a path from {start} to the {target} nodes"))
 
 
-def part_1():
+@cached_parse(15)
+def __parse_risk_map() -> list[list[int]]:
     data = get_question_input(15)
     risk_map: list[list[int]] = []
 
@@ -67,16 +69,17 @@ def part_1():
     for line in data:
         risk_map.append([int(r) for r in line])
 
+    return risk_map
+
+
+def part_1():
+    risk_map = __parse_risk_map()
+
     print(__find_min_risk_total(risk_map))
 
 
 def part_2():
-    data = get_question_input(15)
-    risk_map: list[list[int]] = []
-
-    # Assumes map has uniform width (i.e. map is a rectangle)
-    for line in data:
-        risk_map.append([int(r) for r in line])
+    risk_map = __parse_risk_map()
 
     def _wrap_inc(risk: int, inc: int):
         return (risk - 1 + inc) % 9 + 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from functools import reduce
 from typing import Literal
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
@@ -115,10 +116,16 @@ def _parse_bstr(hex_str: str):
     return bin(int(hex_str, 16))[2:].zfill(len(hex_str * 4))
 
 
-def part_1():
+@cached_parse(16)
+def _parse_packet() -> Packet:
     hex_str = next(get_question_input(16))
     bin_str = _parse_bstr(hex_str)
     packet, _ = _build_packet(bin_str)
+    return packet
+
+
+def part_1():
+    packet = _parse_packet()
     print(_sum_version(packet))
 
 
@@ -158,7 +165,5 @@ def _evaluate_packet(packet: Packet) -> int:
 
 
 def part_2():
-    hex_str = next(get_question_input(16))
-    bin_str = _parse_bstr(hex_str)
-    packet, _ = _build_packet(bin_str)
+    packet = _parse_packet()
     print(_evaluate_packet(packet))
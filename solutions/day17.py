@@ -1,12 +1,26 @@
 from dataclasses import dataclass
 from typing import NamedTuple
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
-def part_1():
+@cached_parse(17)
+def _parse_target_area() -> tuple[int, int, int, int]:
+    """Parses the target area's x_min, x_max, y_min and y_max"""
     data = next(get_question_input(17))
-    y_data = data.split()[-1]
-    y_min, _ = (int(n) for n in y_data.replace("y=", "").split(".."))
+
+    # Parse string data
+    *_, x_data, y_data = data.split()
+    x_data = x_data[:-1].replace("x=", "")
+    y_data = y_data.replace("y=", "")
+
+    x_min, x_max = (int(n) for n in x_data.split(".."))
+    y_min, y_max = (int(n) for n in y_data.split(".."))
+    return x_min, x_max, y_min, y_max
+
+
+def part_1():
+    _, _, y_min, _ = _parse_target_area()
     print(-y_min * (-y_min - 1) / 2)
 
 
@@ -101,15 +115,7 @@ def lands_in_target_area(velocity: XY, target_area: tuple[XY, XY]) -> bool:
 
 
 def part_2():
-    data = next(get_question_input(17))
-
-    # Parse string data
-    *_, x_data, y_data = data.split()
-    x_data = x_data[:-1].replace("x=", "")
-    y_data = y_data.replace("y=", "")
-
-    x_min, x_max = (int(n) for n in x_data.split(".."))
-    y_min, y_max = (int(n) for n in y_data.split(".."))
+    x_min, x_max, y_min, y_max = _parse_target_area()
 
     # Figure out range of velocities to scan through
     if x_min >= 0:
@@ -3,6 +3,7 @@ from collections import namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
 from math import ceil, floor
+from libraries.input_cache import cached_parse
 from libraries.questions import get_question_input
 
 
@@ -219,19 +220,21 @@ class SnailfishNumber:
         return f"[{self.left},{self.right}]"
 
 
-def part_1():
+@cached_parse(18)
+def _parse_snailfish_numbers() -> list[SnailfishNumber]:
     data = get_question_input(18)
-    snailfish_sum = sum(
-        (SnailfishNumber.load(snailfish_str) for snailfish_str in data),
-        start=SnailfishNumber.load(next(data)),
-    )
+    return [SnailfishNumber.load(snailfish_str) for snailfish_str in data]
+
+
+def part_1():
+    first_num, *snailfish_nums = _parse_snailfish_numbers()
+    snailfish_sum = sum(snailfish_nums, start=first_num)
     print(f"Sum: {snailfish_sum}")
     print(f"Magnitude: {snailfish_sum.magnitude()}")
 
 
 def part_2():
-    data = get_question_input(18)
-    snailfish_nums = [SnailfishNumber.load(snailfish_str) for snailfish_str in data]
+    snailfish_nums = _parse_snailfish_numbers()
 
     largest = namedtuple("Largest", ["magnitude", "left", "right"])
     largest.magnitude = 0
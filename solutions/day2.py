@@ -1,30 +1,42 @@
-from libraries.questions import get_question_input
+from __future__ import annotations
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from pathlib import Path
+from typing import NamedTuple
+from libraries.questions import get_input_path, get_question_input, input_is_stdin
 
 
-def part_1():
-    inputs = get_question_input(2)
-    position = 0
-    depth = 0
+class NavigationSummary(NamedTuple):
+    """The net effect of a run of commands, starting from position/depth/aim of 0.
 
-    for cmd in inputs:
-        dir, amt, *_ = cmd.split()
-        if dir == "forward":
-            position += int(amt)
-        elif dir == "up":
-            depth -= int(amt)
-        elif dir == "down":
-            depth += int(amt)
+    Each command is an affine update of (position, depth, aim), so any run of
+    commands can be summarized independently and summaries combined in order.
+    Part 1's depth is the same as part 2's aim.
+    """
 
-    print(position * depth)
+    position: int = 0
+    depth: int = 0
+    aim: int = 0
 
+    def then(self, other: NavigationSummary) -> NavigationSummary:
+        """Combines this summary with the summary of the commands that follow it"""
+        return NavigationSummary(
+            self.position + other.position,
+            # The later commands move forward with this summary's aim added on
+            self.depth + other.depth + self.aim * other.position,
+            self.aim + other.aim,
+        )
 
-def part_2():
-    inputs = get_question_input(2)
-    depth = 0
+
+def summarize_commands(commands: Iterable[str]) -> NavigationSummary:
     position = 0
+    depth = 0
     aim = 0
 
-    for cmd in inputs:
+    for cmd in commands:
+        if not cmd:
+            continue
         dir, amt, *_ = cmd.split()
         if dir == "forward":
             position += int(amt)
@@ -34,4 +46,61 @@ def part_2():
         elif dir == "up":
             aim -= int(amt)
 
-    print(depth * position)
+    return NavigationSummary(position, depth, aim)
+
+
+def _summarize_range(path: Path, start: int, end: int) -> NavigationSummary:
+    """Summarizes the commands in bytes [`start`, `end`) of the file at `path`"""
+    with open(path, "rb") as fp:
+        fp.seek(start)
+        return summarize_commands(fp.read(end - start).decode().splitlines())
+
+
+def _split_ranges(path: Path, num_chunks: int) -> list[tuple[int, int]]:
+    """Splits the file at `path` into roughly `num_chunks` byte ranges, only
+    cutting at line ends
+    """
+    with open(path, "rb") as fp:
+        size = fp.seek(0, 2)
+        chunk_size = max(1, size // num_chunks)
+        ranges = []
+        start = 0
+        while start < size:
+            fp.seek(start + chunk_size)
+            fp.readline()  # Skip to the end of the line the cut landed in
+            end = min(fp.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def navigate_parallel(jobs: int) -> NavigationSummary:
+    """Summarizes the whole command log by reducing chunks of it in `jobs`
+    worker processes, then combining the chunk summaries in order.
+
+    Workers are only sent the byte range of their chunk, and read it from the
+    input file themselves.
+    """
+    path = get_input_path(2)
+    ranges = _split_ranges(path, jobs)
+    with ProcessPoolExecutor(jobs) as executor:
+        summaries = executor.map(_summarize_range, [path] * len(ranges), *zip(*ranges))
+        return reduce(NavigationSummary.then, summaries, NavigationSummary())
+
+
+def _navigate(jobs: int) -> NavigationSummary:
+    # Piped input can only be read once, so is never split between workers
+    if jobs > 1 and not input_is_stdin():
+        return navigate_parallel(jobs)
+    return summarize_commands(get_question_input(2))
+
+
+def part_1(jobs: int = 1):
+    summary = _navigate(jobs)
+    # Without aim, "up"/"down" change depth directly, which is what aim tracks
+    print(summary.position * summary.aim)
+
+
+def part_2(jobs: int = 1):
+    summary = _navigate(jobs)
+    print(summary.depth * summary.position)
@@ -1,8 +1,140 @@
-from typing import Iterable
-from libraries.questions import get_question_input
+from __future__ import annotations
+from bisect import bisect_left
+from collections.abc import Callable
+from itertools import repeat
+import sys
+from libraries.input_cache import cached_parse
+from libraries.print_util import make_red
+from libraries.questions import get_question_input, input_is_stdin, load_question_input
+
+
+# A bit criteria policy decides, given how many remaining readings have a 1 and
+# how many have a 0 at the current bit, whether to keep the ones with the 1
+BitCriteria = Callable[[int, int], bool]
+
+
+def most_common_bit(num_ones: int, num_zeros: int) -> bool:
+    """Oxygen generator criteria; ties keep readings with a 1"""
+    return num_ones >= num_zeros
+
+
+def least_common_bit(num_ones: int, num_zeros: int) -> bool:
+    """CO2 scrubber criteria; ties keep readings with a 0"""
+    return num_ones < num_zeros
+
+
+class BitMatrix:
+    """All diagnostic readings packed column-wise: `columns[j]` is an integer whose
+    bit `r` is the `j`th bit (from the left) of reading `r`.
+
+    Counting set bits in a column, or in a column masked to a subset of readings,
+    is then a single `int.bit_count` over every reading at once.
+    """
+
+    def __init__(self, num_readings: int, columns: list[int]) -> None:
+        self.num_readings = num_readings
+        self.columns = columns
+        self.width = len(columns)
+        self.all_rows = (1 << num_readings) - 1
+
+    def column_counts(self, mask: int | None = None) -> list[int]:
+        """Number of set bits in each column, among the rows selected by `mask`"""
+        mask = self.all_rows if mask is None else mask
+        return [(column & mask).bit_count() for column in self.columns]
+
+    def gamma_rate(self) -> int:
+        gamma_rate = 0
+        for count in self.column_counts():
+            gamma_rate = (gamma_rate << 1) | (count > self.num_readings / 2)
+        return gamma_rate
+
+    def epsilon_rate(self) -> int:
+        return self.gamma_rate() ^ ((1 << self.width) - 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BitMatrix:
+        """Packs newline separated, fixed width binary strings from `data`"""
+        if not data.endswith(b"\n"):
+            data += b"\n"
+        stride = data.index(b"\n") + 1
+        num_readings = len(data) // stride
+
+        if (
+            len(data) % stride != 0
+            or data[stride - 1 :: stride].strip(b"\n")
+            or data.translate(None, b"01\n")  # e.g. `\r` or spaces
+        ):
+            # Not plain fixed width lines; normalize them before packing
+            lines = data.decode().split()
+            if any(len(line) != len(lines[0]) for line in lines):
+                sys.exit(make_red("Diagnostic readings do not have constant width"))
+            if any(line.strip("01") for line in lines):
+                sys.exit(make_red("Diagnostic readings must be binary"))
+            return cls.from_bytes("\n".join(lines).encode())
+
+        # Each column is a strided slice of the raw bytes. Reversing it puts
+        # reading 0 in the least significant bit.
+        columns = [int(data[j::stride][::-1], 2) for j in range(stride - 1)]
+        return cls(num_readings, columns)
+
+
+@cached_parse(3)
+def _parse_bit_matrix() -> BitMatrix:
+    with load_question_input(3) as question_input:
+        return BitMatrix.from_bytes(question_input.raw.tobytes())
+
+
+class PrefixIndex:
+    """Diagnostic readings sorted as integers. Readings sharing their leading
+    bits form a contiguous range, so filtering on the next bit just bisects the
+    current range; each rating query walks `width` bits in O(width * log n).
+    """
+
+    def __init__(self, sorted_readings: list[int], width: int) -> None:
+        self.sorted_readings = sorted_readings
+        self.width = width
+
+    def life_support_rating(self, bit_criteria: BitCriteria) -> int:
+        lo, hi = 0, len(self.sorted_readings)
+        prefix = 0
+
+        for bit in reversed(range(self.width)):
+            if hi - lo <= 1:
+                break  # Only one reading left
+
+            # Readings in [lo, hi) share `prefix`; those with the bit set sort last
+            split = bisect_left(self.sorted_readings, prefix | (1 << bit), lo, hi)
+            if bit_criteria(hi - split, split - lo):
+                lo = split
+                prefix |= 1 << bit
+            else:
+                hi = split
+
+        if hi <= lo:
+            sys.exit(make_red("No diagnostic readings left after filtering"))
+
+        return self.sorted_readings[lo]
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> PrefixIndex:
+        lines = data.split()
+        width = len(lines[0]) if lines else 0
+        return cls(sorted(map(int, lines, repeat(2))), width)
+
+
+@cached_parse(3)
+def _parse_prefix_index() -> PrefixIndex:
+    with load_question_input(3) as question_input:
+        return PrefixIndex.from_bytes(question_input.raw.tobytes())
 
 
 def part_1():
+    if not input_is_stdin():
+        bit_matrix = _parse_bit_matrix()
+        print(bit_matrix.gamma_rate() * bit_matrix.epsilon_rate())
+        return
+
+    # Piped input may not fit in memory, so count bits while streaming instead
     inputs = get_question_input(3)
     bit_set_count = [int(bit) for bit in next(inputs) if bit.isdigit()]
     total_lines = 1
@@ -22,45 +154,9 @@ def part_1():
 
 
 def part_2():
-    o2_gen_candidates, co2_scrub_candidates = __get_candidates(get_question_input(3), 0)
+    prefix_index = _parse_prefix_index()
 
-    idx = 1
-    while len(o2_gen_candidates) > 1:
-        o2_gen_candidates, _ = __get_candidates(o2_gen_candidates, idx)
-        idx += 1
-
-    o2_generator = int(o2_gen_candidates[0], 2)
-
-    idx = 1
-    while len(co2_scrub_candidates) > 1:
-        _, co2_scrub_candidates = __get_candidates(co2_scrub_candidates, idx)
-        idx += 1
-
-    co2_scrubber = int(co2_scrub_candidates[0], 2)
+    o2_generator = prefix_index.life_support_rating(most_common_bit)
+    co2_scrubber = prefix_index.life_support_rating(least_common_bit)
 
     print(o2_generator * co2_scrubber)
-
-
-def __get_candidates(
-    bit_strs: Iterable[str], index: int
-) -> tuple[list[str], list[str]]:
-    """Sort bit strings into ones that are appropriate for oxygen generator vs
-    CO2 scrubbers based on the `index` to examine
-
-    Will return a tuple of two lists, the first being the oxygen generator candidates,
-    and the second being the CO2 scrubber candidates
-    """
-    bit_set_list = []
-    bit_unset_list = []
-
-    for bit_str in bit_strs:
-        if bit_str[index] == "1":
-            bit_set_list.append(bit_str)
-        elif bit_str[index] == "0":
-            bit_unset_list.append(bit_str)
-
-    # return o2_gen_candidates, co2_scrub_candidates
-    if len(bit_set_list) >= len(bit_unset_list):
-        return bit_set_list, bit_unset_list
-    else:
-        return bit_unset_list, bit_set_list
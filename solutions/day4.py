@@ -1,78 +1,141 @@
 from __future__ import annotations
+from array import array
+from itertools import compress, repeat
+from operator import mul
 import sys
+from typing import NamedTuple
+from libraries.input_cache import cached_parse
 from libraries.print_util import make_red, make_bold
-from libraries.questions import get_question_input
+from libraries.questions import load_question_input
 
 
-class BingoBoard:
-    def __init__(self) -> None:
-        self.board_state: list[int] = []
-        self.marked_state: list[bool] = []
+# Maps each mark (0 or 1) to whether the cell is still unmarked
+_UNMARKED = bytes([1]) + bytes(255)
 
-    def is_invalid(self) -> bool:
-        """Determine if the created board is valid"""
-        return len(self.board_state) != 25
 
-    def reset(self):
-        """Reset the marked state of the board"""
-        self.marked_state = [False] * 25
+class BingoBoards:
+    """A batch of bingo boards held in flat arrays, rather than lists per board.
 
-    def get_unmarked_sum(self) -> int:
-        """Returns the sum of all unmarked numbers on the board"""
+    `numbers` holds every board's 25 numbers back to back (row by row), and
+    `marked` a 0/1 byte for each of those cells. An index from each number to
+    the cells holding it means marking a draw only touches the cells it's on,
+    and per row/column hit counts mean a win is noticed as it's marked.
+    """
+
+    _CELLS = 25
+
+    def __init__(self, numbers: array) -> None:
+        if len(numbers) % self._CELLS != 0:
+            sys.exit(make_red(f"Invalid bingo board data: {len(numbers)} numbers"))
+
+        self.numbers = numbers
+        # Each number's cells, with the indexes of the row and column they're in
+        self._number_cells: dict[int, list[tuple[int, int, int]]] = {}
+        for cell, number in enumerate(numbers):
+            board_index, offset = divmod(cell, self._CELLS)
+            row, col = divmod(offset, 5)
+            self._number_cells.setdefault(number, []).append(
+                (cell, board_index * 5 + row, board_index * 5 + col)
+            )
+
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self.numbers) // self._CELLS
+
+    def __getitem__(self, board_index: int) -> BingoBoard:
+        if not 0 <= board_index < len(self):
+            raise IndexError(board_index)
+        return BingoBoard(self, board_index)
+
+    def reset(self):
+        """Reset the marked state of every board"""
+        self.marked = bytearray(len(self.numbers))
+        self.row_hits = bytearray(len(self) * 5)
+        self.col_hits = bytearray(len(self) * 5)
+        self.won = bytearray(len(self))
+
+    def mark(self, draw: int):
+        """Marks off `draw` on every board at once"""
+        for cell, row, col in self._number_cells.get(draw, ()):
+            if self.marked[cell]:
+                continue  # Already drawn
+            self.marked[cell] = 1
+            self.row_hits[row] += 1
+            self.col_hits[col] += 1
+            if self.row_hits[row] == 5 or self.col_hits[col] == 5:
+                self.won[cell // self._CELLS] = 1
+
+    def marked_cells(self, board_index: int) -> bytearray:
+        """The marks (0 or 1) for each of the 25 cells of a board"""
+        start = board_index * self._CELLS
+        return self.marked[start : start + self._CELLS]
+
+    def has_win(self, board_index: int) -> bool:
+        return bool(self.won[board_index])
+
+    def winning_boards(self) -> list[int]:
+        """Indexes of every board which has won so far"""
+        return list(compress(range(len(self)), self.won))
+
+    def unmarked_sums(self) -> list[int]:
+        """The sum of the unmarked numbers on every board"""
+        unmarked = list(map(mul, self.numbers, self.marked.translate(_UNMARKED)))
+        return [
+            sum(unmarked[start : start + self._CELLS])
+            for start in range(0, len(unmarked), self._CELLS)
+        ]
+
+    def get_unmarked_sum(self, board_index: int) -> int:
+        start = board_index * self._CELLS
+        board_numbers = self.numbers[start : start + self._CELLS]
         return sum(
             n
-            for n, is_marked in zip(self.board_state, self.marked_state)
+            for n, is_marked in zip(board_numbers, self.marked_cells(board_index))
             if not is_marked
         )
 
-    def has_win(self) -> bool:
-        """Returns a boolean indicating if there is a winning
-        horizontal/vertical match on the board.
-        """
-        # Check horizontals
-        for i in range(0, 25, 5):
-            if all(self.marked_state[i + j] for j in range(5)):
-                return True
-
-        # Check verticals
-        for i in range(5):
-            if all(self.marked_state[i + j] for j in range(0, 25, 5)):
-                return True
+    @classmethod
+    def from_file_data(cls, file_data: str) -> BingoBoards:
+        """Create bingo boards from whitespace separated numbers, 25 per board"""
+        return cls(array("i", map(int, file_data.split())))
 
-        return False
 
-    def input_draw(self, draw: int):
-        """Marks off the next draw value on the board if found"""
-        try:
-            found_index = self.board_state.index(draw)
-        except ValueError:
-            return
+class BingoBoard:
+    """A single board within a `BingoBoards` batch"""
 
-        self.marked_state[found_index] = True
+    def __init__(self, boards: BingoBoards, board_index: int) -> None:
+        self.boards = boards
+        self.board_index = board_index
 
-    @classmethod
-    def from_file_data(cls, file_lines: list[str]) -> BingoBoard:
-        """Create a bingo board using data from files (expects 5 lines with 5 numbers)"""
-        obj = cls()
-        for line in file_lines:
-            obj.board_state.extend(int(n) for n in line.split(" ") if n)
+    @property
+    def board_state(self) -> list[int]:
+        start = self.board_index * 25
+        return self.boards.numbers[start : start + 25].tolist()
 
-        if obj.is_invalid():
-            sys.exit(make_red(f"Invalid bingo board data:\n{file_lines}"))
+    @property
+    def marked_state(self) -> list[bool]:
+        return [bool(m) for m in self.boards.marked_cells(self.board_index)]
 
-        obj.reset()
+    def get_unmarked_sum(self) -> int:
+        """Returns the sum of all unmarked numbers on the board"""
+        return self.boards.get_unmarked_sum(self.board_index)
 
-        return obj
+    def has_win(self) -> bool:
+        """Returns a boolean indicating if there is a winning
+        horizontal/vertical match on the board.
+        """
+        return self.boards.has_win(self.board_index)
 
     def __repr__(self) -> str:
-        if self.is_invalid():
-            return f"Invalid board: {self.board_state}"
+        board_state = self.board_state
+        marked_state = self.marked_state
 
         text = "-" * 5 + "BINGO BOARD" + "-" * 6 + "\n"
         for i in range(0, 25, 5):
             for j in range(5):
-                entry = f"{self.board_state[i + j]:2}"
-                if self.marked_state[i + j]:
+                entry = f"{board_state[i + j]:2}"
+                if marked_state[i + j]:
                     entry = make_bold(entry)
                 text += f"{entry} | "
             text = text[:-3] + "\n"
@@ -80,82 +143,93 @@ class BingoBoard:
         return text
 
 
-def part_1():
-    inputs = get_question_input(4)
-    draw_order = [int(d) for d in next(inputs).split(",")]
+@cached_parse(4, version=5)
+def _parse_bingo_game() -> tuple[list[int], BingoBoards]:
+    """Parses the draw order and the (unmarked) bingo boards from the input"""
+    with load_question_input(4) as question_input:
+        draw_line, _, board_data = question_input.text.partition("\n")
 
-    boards: list[BingoBoard] = []
+    draw_order = [int(d) for d in draw_line.split(",")]
+    return draw_order, BingoBoards.from_file_data(board_data)
 
-    while next(inputs, None) is not None:  # Skip empty lines separating boards
-        boards.append(BingoBoard.from_file_data([next(inputs) for _ in range(5)]))
 
-    winning_board = None
-    winning_draw = None
+class BoardWin(NamedTuple):
+    turn: int  # Index into the draw order of the winning draw
+    board_index: int
+    score: int
 
-    # Cannot win with <5 draws, so input the first 4 draws blind
-    for draw in draw_order[:4]:
-        for board in boards:
-            board.input_draw(draw)
-    draw_order = draw_order[4:]
 
-    for next_draw in draw_order:
-        for board in boards:
-            board.input_draw(next_draw)
+_NEVER_DRAWN = sys.maxsize
 
-            if board.has_win():
-                winning_board = board
-                break
 
-        if winning_board:
-            winning_draw = next_draw
-            break  # Can stop drawing once someone has won
+def compute_board_wins(draw_order: list[int], boards: BingoBoards) -> list[BoardWin]:
+    """Computes when every board wins, without simulating the draws.
 
-    print(winning_board)
-    if winning_draw is None:
-        print(winning_draw)
-        sys.exit(make_red("Didn't find a winning board"))
+    A line is complete on the turn its last number is drawn, i.e. the max draw
+    turn over its cells, and a board wins on its earliest completed line. Boards
+    are returned in winning order (ties in board order); boards that never win
+    are left out.
+    """
+    draw_turns: dict[int, int] = {}
+    for turn, draw in enumerate(draw_order):
+        draw_turns.setdefault(draw, turn)
 
-    print(f"Score: {winning_board.get_unmarked_sum() * winning_draw}")
+    all_turns = list(map(draw_turns.get, boards.numbers, repeat(_NEVER_DRAWN)))
 
+    wins: list[BoardWin] = []
+    for board_index in range(len(boards)):
+        start = board_index * 25
+        turns = all_turns[start : start + 25]
+        win_turn = min(
+            *(max(turns[i : i + 5]) for i in range(0, 25, 5)),
+            *(max(turns[i::5]) for i in range(5)),
+        )
+        if win_turn == _NEVER_DRAWN:
+            continue
 
-def part_2():
-    inputs = get_question_input(4)
-    draw_order = [int(d) for d in next(inputs).split(",")]
+        board_numbers = boards.numbers[start : start + 25]
+        unmarked_sum = sum(n for n, t in zip(board_numbers, turns) if t > win_turn)
+        wins.append(BoardWin(win_turn, board_index, unmarked_sum * draw_order[win_turn]))
 
-    boards: list[BingoBoard] = []
+    wins.sort()
+    return wins
 
-    while next(inputs, None) is not None:  # Skip empty lines separating boards
-        boards.append(BingoBoard.from_file_data([next(inputs) for _ in range(5)]))
 
-    final_board = None
-    final_draw = None
+def _print_board_at_win(draw_order: list[int], boards: BingoBoards, board_win: BoardWin):
+    """Prints the winning board, marked up to its winning draw, and its score"""
+    boards.reset()
+    for draw in draw_order[: board_win.turn + 1]:
+        boards.mark(draw)
 
-    # Cannot win with <5 draws, so input the first 4 draws blind
-    for draw in draw_order[:4]:
-        for board in boards:
-            board.input_draw(draw)
-    draw_order = draw_order[4:]
+    # The replayed marks must agree with the computed win
+    unmarked_sum = boards.unmarked_sums()[board_win.board_index]
+    if (
+        board_win.board_index not in boards.winning_boards()
+        or unmarked_sum * draw_order[board_win.turn] != board_win.score
+    ):
+        sys.exit(make_red(f"Board {board_win.board_index} didn't win as computed"))
 
-    for next_draw in draw_order:
-        remaining_boards = []
+    print(boards[board_win.board_index])
+    print(f"Score: {board_win.score}")
 
-        for board in boards:
-            board.input_draw(next_draw)
 
-            if board.has_win():
-                final_board = board  # `final_board` keeps updating until last one wins
-            else:
-                remaining_boards.append(board)
+def part_1():
+    draw_order, boards = _parse_bingo_game()
+    board_wins = compute_board_wins(draw_order, boards)
 
-        if not remaining_boards:
-            final_draw = next_draw
-            break  # All boards have won; can stop drawing
+    if not board_wins:
+        print(None)
+        sys.exit(make_red("Didn't find a winning board"))
+
+    _print_board_at_win(draw_order, boards, board_wins[0])
 
-        boards = remaining_boards  # Otherwise, transfer remaining boards to continue checking
 
-    print(final_board)
-    if final_draw is None:
-        print(final_draw)
+def part_2():
+    draw_order, boards = _parse_bingo_game()
+    board_wins = compute_board_wins(draw_order, boards)
+
+    if len(board_wins) < len(boards):
+        print(None)
         sys.exit(make_red("Still some boards remainining..."))
 
-    print(f"Score: {final_board.get_unmarked_sum() * final_draw}")
+    _print_board_at_win(draw_order, boards, board_wins[-1])
@@ -1,69 +1,295 @@
-import itertools
-from libraries.questions import get_question_input
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
+from itertools import combinations, starmap
+from operator import itemgetter
+import re
+import sys
+from typing import NamedTuple
+from libraries.input_cache import cached_parse
+from libraries.print_util import make_red
+from libraries.questions import load_question_input
 
 
-def part_1():
-    data = get_question_input(5)
-    unpaired_points: set[tuple[int, int]] = set()
-    paired_points: set[tuple[int, int]] = set()
+class VentLine(NamedTuple):
+    x1: int
+    y1: int
+    x2: int
+    y2: int
 
-    for line in data:
-        coords1, coords2 = line.split(" -> ")
-        x1, y1 = [int(n) for n in coords1.split(",")]
-        x2, y2 = [int(n) for n in coords2.split(",")]
+    def is_axis_aligned(self) -> bool:
+        return self.x1 == self.x2 or self.y1 == self.y2
 
-        if x1 != x2 and y1 != y2:
-            continue  # Only consider horizontal / vertical lines
+    def is_diagonal(self) -> bool:
+        return abs(self.x1 - self.x2) == abs(self.y1 - self.y2)
 
-        for point in __get_point_generator(x1, y1, x2, y2):
-            if point in paired_points:
-                continue
-            elif point in unpaired_points:
-                unpaired_points.remove(point)
-                paired_points.add(point)
-            else:
-                unpaired_points.add(point)
 
-    print(len(paired_points))
+@cached_parse(5)
+def _parse_vent_lines() -> list[VentLine]:
+    """Parses every `x1,y1 -> x2,y2` line, pulling all the numbers in one pass"""
+    with load_question_input(5) as question_input:
+        numbers = list(map(int, re.findall(rb"-?\d+", question_input.raw)))
 
+    if len(numbers) % 4 != 0:
+        sys.exit(make_red("Vent lines must each have two x,y coordinates"))
+    return list(starmap(VentLine, zip(*[iter(numbers)] * 4)))
 
-def part_2():
-    data = get_question_input(5)
-    unpaired_points: set[tuple[int, int]] = set()
-    paired_points: set[tuple[int, int]] = set()
-
-    for line in data:
-        coords1, coords2 = line.split(" -> ")
-        x1, y1 = [int(n) for n in coords1.split(",")]
-        x2, y2 = [int(n) for n in coords2.split(",")]
-
-        if x1 != x2 and y1 != y2 and abs(x1 - x2) != abs(y1 - y2):
-            continue  # Only consider horizontal / vertical / 45 degree lines
-
-        for point in __get_point_generator(x1, y1, x2, y2):
-            if point in paired_points:
-                continue
-            elif point in unpaired_points:
-                unpaired_points.remove(point)
-                paired_points.add(point)
-            else:
-                unpaired_points.add(point)
-
-    print(len(paired_points))
-
-
-def __get_point_generator(x1: int, y1: int, x2: int, y2: int):
-    """Returns a generator which will list all points between the given coordinates"""
-
-    def _get_axis_generator(axis_start: int, axis_end: int):
-        if axis_start == axis_end:
-            return itertools.repeat(axis_start)
-        elif axis_start < axis_end:
-            return range(axis_start, axis_end + 1)
+
+# Grids larger than this many cells (one byte each) aren't rasterized
+MAX_GRID_CELLS = 1 << 26
+
+# Counts saturate at 2, which is all that's needed to find overlaps
+_SATURATING_INCREMENT = bytes([1, 2] + [2] * 254)
+
+
+class VentGrid:
+    """A row-major counting grid, adding each line as one strided slice"""
+
+    def __init__(self, min_x: int, min_y: int, width: int, height: int) -> None:
+        self.min_x = min_x
+        self.min_y = min_y
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+
+    def _index(self, x: int, y: int) -> int:
+        return (y - self.min_y) * self.width + (x - self.min_x)
+
+    def add_line(self, line: VentLine):
+        step_x = (line.x2 > line.x1) - (line.x2 < line.x1)
+        step_y = (line.y2 > line.y1) - (line.y2 < line.y1)
+        start = self._index(line.x1, line.y1)
+        end = self._index(line.x2, line.y2)
+        step = step_y * self.width + step_x or 1  # A single point can take any step
+
+        if start > end:
+            start, end, step = end, start, -step
+        line_cells = slice(start, end + 1, step)
+        self.cells[line_cells] = self.cells[line_cells].translate(_SATURATING_INCREMENT)
+
+    def count_overlaps(self) -> int:
+        """Number of points covered by at least two lines"""
+        return self.cells.count(2)
+
+    @classmethod
+    def fit(cls, lines: list[VentLine]) -> VentGrid | None:
+        """An empty grid just covering `lines`, or None if it would be too large"""
+        if not lines:
+            return cls(0, 0, 1, 1)
+
+        xs = [x for line in lines for x in (line.x1, line.x2)]
+        ys = [y for line in lines for y in (line.y1, line.y2)]
+        width = max(xs) - min(xs) + 1
+        height = max(ys) - min(ys) + 1
+        if width * height > MAX_GRID_CELLS:
+            return None
+        return cls(min(xs), min(ys), width, height)
+
+
+def rasterize_overlaps(lines: list[VentLine]) -> tuple[int, int] | None:
+    """Counts overlapping points among the axis aligned lines, then among all
+    the axis aligned and 45 degree lines, on a single grid.
+
+    Returns None when the lines span too large an area for a dense grid.
+    """
+    grid = VentGrid.fit(lines)
+    if grid is None:
+        return None
+
+    for line in lines:
+        if line.is_axis_aligned():
+            grid.add_line(line)
+    axis_aligned_overlaps = grid.count_overlaps()
+
+    for line in lines:
+        if not line.is_axis_aligned() and line.is_diagonal():
+            grid.add_line(line)
+    return axis_aligned_overlaps, grid.count_overlaps()
+
+
+class LineFamily(NamedTuple):
+    """All the lines `a * x + b * y = key`, e.g. (0, 1) are the horizontal lines"""
+
+    a: int
+    b: int
+
+    def key(self, x: int, y: int) -> int:
+        return self.a * x + self.b * y
+
+    def position(self, x: int, y: int) -> int:
+        """Where (x, y) lies along its line; consecutive points differ by 1"""
+        return y if self.b == 0 else x
+
+    def point(self, key: int, position: int) -> tuple[int, int]:
+        if self.b == 0:
+            return key, position
+        return position, (key - self.a * position) // self.b  # b is 1 or -1
+
+
+HORIZONTAL = LineFamily(0, 1)
+VERTICAL = LineFamily(1, 0)
+DIAGONAL = LineFamily(1, -1)
+ANTI_DIAGONAL = LineFamily(1, 1)
+
+
+def _line_family(line: VentLine) -> LineFamily | None:
+    if line.y1 == line.y2:
+        return HORIZONTAL
+    elif line.x1 == line.x2:
+        return VERTICAL
+    elif line.x2 - line.x1 == line.y2 - line.y1:
+        return DIAGONAL
+    elif line.x2 - line.x1 == line.y1 - line.y2:
+        return ANTI_DIAGONAL
+    return None
+
+
+class _Coverage(NamedTuple):
+    """Sorted, disjoint, inclusive position ranges along one line"""
+
+    covered: list[tuple[int, int]]  # Covered by at least one vent line
+    overlapped: list[tuple[int, int]]  # Covered by at least two vent lines
+
+
+def _coverage(ranges: list[tuple[int, int]]) -> _Coverage:
+    """Sweeps the start/end events of collinear `ranges` to find their coverage"""
+    deltas: dict[int, int] = {}
+    for lo, hi in ranges:
+        deltas[lo] = deltas.get(lo, 0) + 1
+        deltas[hi + 1] = deltas.get(hi + 1, 0) - 1
+
+    coverage = _Coverage([], [])
+    starts = [0, 0]
+    depth = 0
+    for position in sorted(deltas):
+        prev_depth, depth = depth, depth + deltas[position]
+        # Each list of ranges in the coverage is for one more line than the last
+        for min_depth, covered in enumerate(coverage, start=1):
+            if prev_depth < min_depth <= depth:
+                starts[min_depth - 1] = position
+            elif depth < min_depth <= prev_depth:
+                covered.append((starts[min_depth - 1], position - 1))
+    return coverage
+
+
+def _in_ranges(ranges: list[tuple[int, int]], position: int) -> bool:
+    i = bisect_right(ranges, position, key=itemgetter(0)) - 1
+    return i >= 0 and ranges[i][1] >= position
+
+
+def _key_span(
+    family: LineFamily, key: int, positions: tuple[int, int], span_family: LineFamily
+) -> list[int]:
+    """The lowest and highest `span_family` keys along a range of a line"""
+    return sorted(span_family.key(*family.point(key, p)) for p in positions)
+
+
+def _crossings(
+    family: LineFamily,
+    family_ranges: dict[int, list[tuple[int, int]]],
+    other: LineFamily,
+    other_ranges: dict[int, list[tuple[int, int]]],
+) -> Iterator[tuple[int, int]]:
+    """Yields the integer points where covered ranges of two (non parallel)
+    families of lines cross.
+
+    In (family key, other key) coordinates, the lines of `family` are vertical
+    and those of `other` horizontal, so this is a sweep over the family keys,
+    keeping the active other keys sorted, which costs O((n + crossings) log n).
+    """
+
+    events = []
+    for key, ranges in other_ranges.items():
+        for lo, hi in ranges:
+            start, end = _key_span(other, key, (lo, hi), family)
+            events.append((start, 0, key))
+            events.append((end, 2, key))
+    for key, ranges in family_ranges.items():
+        for lo, hi in ranges:
+            events.append((key, 1, *_key_span(family, key, (lo, hi), other)))
+    events.sort()
+
+    det = family.a * other.b - other.a * family.b
+    active: list[int] = []
+    for key, kind, *args in events:
+        if kind == 0:
+            insort(active, args[0])
+        elif kind == 2:
+            del active[bisect_left(active, args[0])]
         else:
-            return range(axis_start, axis_end - 1, -1)
+            lo, hi = args
+            for i in range(bisect_left(active, lo), bisect_right(active, hi)):
+                x, x_rem = divmod(key * other.b - active[i] * family.b, det)
+                y, y_rem = divmod(family.a * active[i] - other.a * key, det)
+                if x_rem == 0 and y_rem == 0:  # Diagonals can cross between points
+                    yield x, y
+
 
-    x_gen = _get_axis_generator(x1, x2)
-    y_gen = _get_axis_generator(y1, y2)
+def count_overlaps_by_sweep(lines: list[VentLine], include_diagonals: bool) -> int:
+    """Counts overlapping points from the line endpoints alone, so the cost
+    depends on the number of lines and overlaps, not the lines' lengths.
 
-    return zip(x_gen, y_gen)
+    Collinear lines are merged per row, column or diagonal into the ranges
+    covered at least once and at least twice. Every overlapped range point
+    counts, then each point where covered ranges of two directions cross is
+    counted once, less the times it was already counted as overlapped.
+    """
+    families = [HORIZONTAL, VERTICAL]
+    if include_diagonals:
+        families += [DIAGONAL, ANTI_DIAGONAL]
+
+    ranges: dict[LineFamily, dict[int, list[tuple[int, int]]]] = {
+        family: {} for family in families
+    }
+    for line in lines:
+        if (family := _line_family(line)) not in ranges:
+            continue
+        p1 = family.position(line.x1, line.y1)
+        p2 = family.position(line.x2, line.y2)
+        key_ranges = ranges[family].setdefault(family.key(line.x1, line.y1), [])
+        key_ranges.append((min(p1, p2), max(p1, p2)))
+
+    coverages = {
+        family: {key: _coverage(key_ranges) for key, key_ranges in family_ranges.items()}
+        for family, family_ranges in ranges.items()
+    }
+    covered = {
+        family: {key: coverage.covered for key, coverage in family_coverages.items()}
+        for family, family_coverages in coverages.items()
+    }
+
+    overlaps = sum(
+        hi - lo + 1
+        for family_coverages in coverages.values()
+        for coverage in family_coverages.values()
+        for lo, hi in coverage.overlapped
+    )
+
+    crossings = set()
+    for family, other in combinations(families, 2):
+        crossings.update(_crossings(family, covered[family], other, covered[other]))
+
+    for point in crossings:
+        times_counted = 0
+        for family, family_coverages in coverages.items():
+            coverage = family_coverages.get(family.key(*point))
+            if coverage and _in_ranges(coverage.overlapped, family.position(*point)):
+                times_counted += 1
+        overlaps += 1 - times_counted
+
+    return overlaps
+
+
+def _count_overlaps(include_diagonals: bool) -> int:
+    lines = _parse_vent_lines()
+    if (overlaps := rasterize_overlaps(lines)) is not None:
+        return overlaps[include_diagonals]
+    return count_overlaps_by_sweep(lines, include_diagonals)
+
+
+def part_1():
+    print(_count_overlaps(include_diagonals=False))
+
+
+def part_2():
+    print(_count_overlaps(include_diagonals=True))
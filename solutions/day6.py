@@ -1,25 +1,157 @@
-from libraries.questions import get_question_input
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+from operator import mul
+import sys
+from libraries.input_cache import cached_parse
+from libraries.print_util import make_red
+from libraries.questions import load_question_input
 
+Matrix = list[list[int]]
 
-def part_1(num_days=80):
-    data = get_question_input(6)
-    lanternfish_age_groups = [0] * 9
+NUM_AGES = 9
+
+
+def _build_transition() -> Matrix:
+    """One day's transition of the age histogram: `new = transition @ old`"""
+    transition = [[0] * NUM_AGES for _ in range(NUM_AGES)]
+    for age in range(1, NUM_AGES):
+        transition[age - 1][age] = 1  # Age all other lanternfish by 1
+    transition[6][0] = 1  # Resetting parents
+    transition[8][0] = 1  # Adding babies
+    return transition
+
+
+_TRANSITION = _build_transition()
+
+
+class PopulationProjector:
+    """Projects lanternfish age histograms any number of days ahead, in
+    O(log num_days) 9x9 matrix steps instead of one step per day.
+
+    The transition matrix raised to each power of two days is squared from the
+    last one and cached, so later projections only pay for the vector products.
+    Counts are exact integers, or reduced by `modulus` if given, which keeps
+    very long horizons (whose exact counts have billions of digits) fast.
+    """
+
+    def __init__(self, modulus: int | None = None) -> None:
+        self.modulus = modulus
+        # `_powers[k]` is the transition over 2**k days
+        self._powers: list[Matrix] = [self._reduce_matrix(_TRANSITION)]
+        self._weights: dict[int, list[int]] = {}
+
+    def _reduce(self, value: int) -> int:
+        return value if self.modulus is None else value % self.modulus
+
+    def _reduce_matrix(self, matrix: Matrix) -> Matrix:
+        return [[self._reduce(value) for value in row] for row in matrix]
+
+    def _power(self, k: int) -> Matrix:
+        """The transition over 2**k days"""
+        while len(self._powers) <= k:
+            last = self._powers[-1]
+            columns = list(zip(*last))
+            self._powers.append(
+                [[self._reduce(sum(map(mul, row, col))) for col in columns] for row in last]
+            )
+        return self._powers[k]
+
+    def _day_powers(self, num_days: int) -> Iterable[Matrix]:
+        """The cached powers which multiply together to `num_days` of transitions"""
+        if num_days < 0:
+            raise ValueError(f"Can't project a negative number of days: {num_days}")
+        return (self._power(k) for k in range(num_days.bit_length()) if num_days >> k & 1)
+
+    def project(self, histogram: Sequence[int], num_days: int) -> list[int]:
+        """The age histogram after `num_days`"""
+        histogram = [self._reduce(count) for count in histogram]
+        for matrix in self._day_powers(num_days):
+            histogram = [self._reduce(sum(map(mul, row, histogram))) for row in matrix]
+        return histogram
+
+    def population_weights(self, num_days: int) -> list[int]:
+        """How many fish a single fish of each age becomes after `num_days`.
 
-    for age in next(data).split(","):
-        lanternfish_age_groups[int(age)] += 1
+        A population is then just the dot product of these with a histogram.
+        """
+        if num_days not in self._weights:
+            # Powers of one matrix commute, so can be applied in any order
+            weights = [self._reduce(1)] * NUM_AGES
+            for matrix in self._day_powers(num_days):
+                weights = [
+                    self._reduce(sum(map(mul, weights, col))) for col in zip(*matrix)
+                ]
+            self._weights[num_days] = weights
+        return self._weights[num_days]
 
-    for _ in range(num_days):
-        # Temp track lanternfishes giving birth
-        lanternfish_births = lanternfish_age_groups[0]
+    def population(self, histogram: Sequence[int], num_days: int) -> int:
+        """The total number of lanternfish after `num_days`"""
+        return self._reduce(sum(map(mul, self.population_weights(num_days), histogram)))
 
-        # Age all other lanternfish by 1
-        for i in range(1, 9):
-            lanternfish_age_groups[i - 1] = lanternfish_age_groups[i]
+    def populations(self, queries: Iterable[tuple[Sequence[int], int]]) -> list[int]:
+        """Answers a batch of (histogram, num_days) population queries"""
+        return [self.population(histogram, num_days) for histogram, num_days in queries]
 
-        lanternfish_age_groups[6] += lanternfish_births  # Resetting parents
-        lanternfish_age_groups[8] = lanternfish_births  # Adding babies
 
-    print(sum(lanternfish_age_groups))
+_exact_projector = PopulationProjector()
+
+
+_AGE_DIGITS = b"012345678"
+
+
+@cached_parse(6)
+def _parse_age_histograms() -> list[list[int]]:
+    """Parses an age histogram from every line of comma separated ages"""
+    with load_question_input(6) as question_input:
+        lines = question_input.raw.tobytes().splitlines()
+
+    histograms = []
+    for line in map(bytes.strip, lines):
+        if not line:
+            continue
+        # Ages are single digits, so count each digit
+        histogram = [line.count(digit) for digit in _AGE_DIGITS]
+        if sum(histogram) != line.count(b",") + 1:
+            sys.exit(make_red(f"Invalid lanternfish ages: {line[:50].decode()!r}"))
+        histograms.append(histogram)
+    return histograms
+
+
+def forecast_populations(
+    histograms: Sequence[Sequence[int]],
+    horizons: Sequence[int],
+    projector: PopulationProjector = _exact_projector,
+) -> list[list[int]]:
+    """The population of every histogram at every horizon, as a matrix with a
+    row per histogram and a column per horizon.
+
+    The population weights for each horizon are computed once (a 9 x horizons
+    matrix), so each entry is just a 9 term dot product with a histogram, rather
+    than a simulation from day 0 for each histogram and horizon.
+    """
+    for num_days in set(horizons):
+        projector.population_weights(num_days)  # Fill the cache up front
+
+    return [
+        [projector.population(histogram, num_days) for num_days in horizons]
+        for histogram in histograms
+    ]
+
+
+def forecast_input_populations(
+    horizons: Sequence[int], modulus: int | None = None
+) -> list[list[int]]:
+    """Forecasts the populations of every line of the day's input at once"""
+    projector = _exact_projector if modulus is None else PopulationProjector(modulus)
+    return forecast_populations(_parse_age_histograms(), horizons, projector)
+
+
+def part_1(num_days=80):
+    histograms = _parse_age_histograms()
+    if not histograms:
+        sys.exit(make_red("No lanternfish ages in the input"))
+
+    print(_exact_projector.population(histograms[0], num_days))
 
 
 def part_2():
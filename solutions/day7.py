@@ -1,52 +1,154 @@
-import math
-from libraries.questions import get_question_input
+from __future__ import annotations
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable
+from functools import partial
+from itertools import accumulate, repeat
+from operator import mul, sub
+import re
+import sys
+from libraries.input_cache import cached_parse
+from libraries.print_util import make_red
+from libraries.questions import load_question_input
+
+
+# Fuel used by one crab to move a given distance. Any cost which is convex in the
+# distance gives a total cost which is convex in the target, so can be optimized.
+StepCost = Callable[[int], int]
+
+
+def linear_step_cost(distance: int) -> int:
+    return distance
+
+
+def triangular_step_cost(distance: int) -> int:
+    """The sum of the arithmetic series 1..distance, in exact integers"""
+    return distance * (distance + 1) // 2
+
+
+def minimize_convex(cost: Callable[[int], int], lo: int, hi: int) -> tuple[int, int]:
+    """Finds a target in [lo, hi] with the lowest `cost`, and that cost, by an
+    integer ternary search; `cost` must be convex over the range.
+    """
+    while hi - lo > 2:
+        third = (hi - lo) // 3
+        left, right = lo + third, hi - third
+        left_cost, right_cost = cost(left), cost(right)
+        if left_cost < right_cost:
+            hi = right - 1
+        elif left_cost > right_cost:
+            lo = left + 1
+        else:
+            # Equal costs either side of the minimum, or on a flat bottom
+            lo, hi = left, right
+
+    return min(((cost(target), target) for target in range(lo, hi + 1)))[::-1]
+
+
+class CrabHistogram:
+    """Crab counts for every position in [min_position, max_position], kept as
+    prefix sums of the counts and of the count weighted positions.
+
+    After the O(range) set up, the median, and the fuel cost to align on any
+    target, are each answered in O(1) (or O(log range)) from the prefix sums,
+    rather than by sorting or scanning every crab.
+    """
+
+    def __init__(self, counts: list[int], min_position: int) -> None:
+        if not counts:
+            sys.exit(make_red("No crab positions given"))
+
+        self.min_position = min_position
+        self.max_position = min_position + len(counts) - 1
+        positions = range(min_position, self.max_position + 1)
+
+        occupied = [(p, count) for p, count in zip(positions, counts) if count]
+        self._positions = [p for p, _ in occupied]
+        self._counts = [count for _, count in occupied]
+
+        # Index i covers the crabs with positions below `min_position + i`
+        self._counts_below = list(accumulate(counts, initial=0))
+        self._sums_below = list(accumulate(map(mul, counts, positions), initial=0))
+        self.num_crabs = self._counts_below[-1]
+        self.total = self._sums_below[-1]
+        self.total_squares = sum(map(mul, counts, map(mul, positions, positions)))
+
+    def median(self) -> int:
+        """The (lower) median crab position"""
+        rank = (self.num_crabs - 1) // 2
+        return self.min_position + bisect_right(self._counts_below, rank) - 1
+
+    def linear_cost(self, target: int) -> int:
+        """Total fuel to move every crab to `target`, one unit per step"""
+        i = min(max(target - self.min_position + 1, 0), len(self._counts_below) - 1)
+        count_le, sum_le = self._counts_below[i], self._sums_below[i]
+        count_gt, sum_gt = self.num_crabs - count_le, self.total - sum_le
+        return (target * count_le - sum_le) + (sum_gt - target * count_gt)
+
+    def triangular_cost(self, target: int) -> int:
+        """Total fuel to move every crab to `target`, where the nth step costs n.
+
+        A move of d steps costs d(d+1)/2, so the total is half of the sum of
+        squared distances (expanded in terms of the totals) plus the sum of
+        distances, all in exact integers.
+        """
+        squared_distances = (
+            self.total_squares - 2 * target * self.total + self.num_crabs * target**2
+        )
+        return (squared_distances + self.linear_cost(target)) // 2
+
+    def cost(self, step_cost: StepCost, target: int) -> int:
+        """Total fuel to move every crab to `target` with any `step_cost`"""
+        distances = map(abs, map(sub, self._positions, repeat(target)))
+        return sum(map(mul, self._counts, map(step_cost, distances)))
+
+    def optimize(self, step_cost: StepCost) -> tuple[int, int]:
+        """The target with the lowest total fuel for a convex `step_cost`, and
+        that fuel, in O(log range) total cost evaluations
+        """
+        return minimize_convex(
+            partial(self.cost, step_cost), self.min_position, self.max_position
+        )
+
+    def cost_curve(self, cost: Callable[[int], int]) -> list[int]:
+        """`cost` of every target position from `min_position` to `max_position`"""
+        return list(map(cost, range(self.min_position, self.max_position + 1)))
+
+    @classmethod
+    def from_positions(cls, positions: Counter[int]) -> CrabHistogram:
+        if not positions:
+            return cls([], 0)
+        min_position = min(positions)
+        return cls(
+            [positions[p] for p in range(min_position, max(positions) + 1)], min_position
+        )
+
+
+@cached_parse(7, version=2)
+def _parse_crab_histogram() -> CrabHistogram:
+    with load_question_input(7) as question_input:
+        positions = Counter(map(int, re.findall(rb"-?\d+", question_input.raw)))
+    return CrabHistogram.from_positions(positions)
 
 
 def part_1():
-    data = get_question_input(7)
-    crab_positions = [int(p) for p in next(data).split(",")]
+    crabs = _parse_crab_histogram()
 
     # The ideal position is just the median of all the positions in this case
-    num_crabs = len(crab_positions)
-    crab_positions.sort()
-    if num_crabs % 2 != 0:
-        # For odd length lists, the median is the middle number
-        ideal_position = crab_positions[num_crabs // 2]
-    else:
-        # For even length lists, the median is the average of the middle numbers
-        ideal_position = (
-            crab_positions[num_crabs // 2] + crab_positions[num_crabs // 2 - 1]
-        ) // 2
-
-    ideal_usage = sum(abs(p - ideal_position) for p in crab_positions)
-    print(ideal_usage)
+    print(crabs.linear_cost(crabs.median()))
 
 
 def part_2():
-    data = get_question_input(7)
-    crab_positions = [int(p) for p in next(data).split(",")]
-
-    def _calculate_usage(t: int):
-        """Calculates usage using sum of arithmetic series formula, (n+1)*n/2"""
-        return int(sum((abs(p - t) + 1) * abs(p - t) / 2 for p in crab_positions))
-
-    # The ideal position is just the mean of all positions in this case
-    ideal_position = sum(crab_positions) / len(crab_positions)
-
-    if ideal_position.is_integer():
-        ideal_position = int(ideal_position)
-        ideal_usage = _calculate_usage(ideal_position)
-    else:
-        # Target cannot be decimal so we'll test both integers around the target
-        ideal_position = int(ideal_position)
-        ideal_usage = _calculate_usage(ideal_position)
-
-        contest_usage = _calculate_usage(ideal_position + 1)
-        if contest_usage < ideal_usage:
-            ideal_position += 1
-            ideal_usage = contest_usage
-
-    print(ideal_usage)
+    crabs = _parse_crab_histogram()
+
+    # The ideal position is within 1/2 of the mean, so test the integers around it
+    ideal_position = crabs.total // crabs.num_crabs
+    print(
+        min(
+            crabs.triangular_cost(ideal_position),
+            crabs.triangular_cost(ideal_position + 1),
+        )
+    )
 
 
 """
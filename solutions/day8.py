@@ -1,25 +1,50 @@
+from collections import Counter
 import sys
+from libraries.input_cache import cached_parse
 from libraries.print_util import make_red
 from libraries.questions import get_question_input
 
 
+@cached_parse(8)
+def __parse_displays() -> list[tuple[list[str], list[str]]]:
+    """Parses the (wirings, outputs) of every display"""
+    displays: list[tuple[list[str], list[str]]] = []
+    for line in get_question_input(8):
+        wirings, outputs = [s.split() for s in line.split(" | ")]
+        displays.append((wirings, outputs))
+    return displays
+
+
 def part_1():
-    data = get_question_input(8)
     # 1, 4, 7, 8 use 2, 4, 3, 7 segments respectively
     SPECIAL_SEGMENT_COUNTS = [2, 4, 3, 7]
     simple_numbers_count = 0
 
-    for line in data:
-        output = line.split(" | ")[1]
+    for _, outputs in __parse_displays():
         simple_numbers_count += sum(
             1
-            for out_digit in output.split()
+            for out_digit in outputs
             if len(out_digit) in SPECIAL_SEGMENT_COUNTS
         )
 
     print(simple_numbers_count)
 
 
+def _build_score_digits(
+    digit_segment_maps: list[tuple[int, set[str]]]
+) -> dict[int, int]:
+    """Maps each digit's segment frequency score back to the digit"""
+    segment_frequencies = Counter(
+        segment for _, segments in digit_segment_maps for segment in segments
+    )
+    score_digits = {
+        sum(map(segment_frequencies.__getitem__, segments)): digit
+        for digit, segments in digit_segment_maps
+    }
+    assert len(score_digits) == len(digit_segment_maps), "Digit scores must be unique"
+    return score_digits
+
+
 class DigitTranslator:
     """
     Visual Diagram:
@@ -30,6 +55,12 @@ class DigitTranslator:
     e     f
     e     f
      ggggg
+
+    Wirings are encoded as 7-bit masks, one bit per segment. Across all ten
+    digits each segment is lit a fixed number of times (e.g. `e` in 4 digits, `f`
+    in 9), whatever it's wired to, and summing those frequencies over a digit's
+    segments gives a different score for every digit. So each wiring's digit is
+    a lookup of its score, and each display a lookup of its mask.
     """
 
     # Set of all segments
@@ -49,94 +80,63 @@ class DigitTranslator:
         (9, {"a", "b", "c", "d", "f", "g"}),
     ]
 
+    SEGMENT_BITS = {segment: 1 << i for i, segment in enumerate(sorted(ALL_SEGMENTS))}
+
+    # Masks of every segment string seen so far; there are under 14k orderings
+    # of distinct segments, so after warming up, encoding is a single lookup
+    _segment_masks: dict[str, int] = {}
+
+    # Digit for each segment frequency score, e.g. 1 (`c` and `f`) scores 8 + 9
+    SCORE_DIGITS = _build_score_digits(DIGIT_AND_SEGMENT_MAPS)
+
     def __init__(self, wirings: list[str]) -> None:
-        # Translations for individual segments
-        self.segment_map: dict[str, str]
-        # Digit + translated segment map pair
-        self.digit_translations: list[tuple[int, set[str]]]
+        # Digit for each (translated) segment mask
+        self.mask_digits: dict[int, int]
 
         try:
             self.build_translations(wirings)
         except:
             sys.exit(make_red(f"Failed setting up translations for wirings: {wirings}"))
 
+    @classmethod
+    def to_mask(cls, segments: str) -> int:
+        mask = cls._segment_masks.get(segments)
+        if mask is None:
+            mask = sum(map(cls.SEGMENT_BITS.__getitem__, set(segments)))
+            cls._segment_masks[segments] = mask
+        return mask
+
     def build_translations(self, wirings: list[str]):
-        """Build the segment translation table given the current wirings for the 10 digits"""
+        """Build the mask translation table given the current wirings for the 10 digits"""
         if len(wirings) != 10:
             raise Exception()
 
-        wiring_sets = [{c for c in w} for w in wirings]
-        self.segment_map = {}
-
-        # Determine `a` using wirings of 7 and 1:
-        one_wiring = next(w for w in wiring_sets if len(w) == 2)
-        seven_wiring = next(w for w in wiring_sets if len(w) == 3)
-        self.segment_map["a"] = (seven_wiring - one_wiring).pop()
-
-        # Determine `c` using wiring of 6
-        six_seg_wirings = [w for w in wiring_sets if len(w) == 6]  # Contains 0, 6, 9
-        # Only 6 does not contain both segments in 1
-        six_wiring = next(s for s in six_seg_wirings if not s.issuperset(one_wiring))
-        self.segment_map["c"] = (DigitTranslator.ALL_SEGMENTS - six_wiring).pop()
-
-        # Determine wiring of 9 using wiring of 4; then determine `e` using wiring of 9
-        six_seg_wirings.remove(six_wiring)  # Now contains 0, 9
-        four_wiring = next(w for w in wiring_sets if len(w) == 4)
-        nine_wiring = next(s for s in six_seg_wirings if s.issuperset(four_wiring))
-        self.segment_map["e"] = (DigitTranslator.ALL_SEGMENTS - nine_wiring).pop()
-
-        # Determine `d` using wiring of 0
-        six_seg_wirings.remove(nine_wiring)  # Now contains 0
-        zero_wiring = six_seg_wirings[0]
-        self.segment_map["d"] = (DigitTranslator.ALL_SEGMENTS - zero_wiring).pop()
-
-        # Determine `f` using `c` and wiring of 1
-        self.segment_map["f"] = (one_wiring - {self.segment_map["c"]}).pop()
-
-        # Determine `b` using `c`, `d`, `f` and wiring of 4
-        temp_set_for_b = four_wiring - {
-            self.segment_map["c"],
-            self.segment_map["d"],
-            self.segment_map["f"],
-        }
-        self.segment_map["b"] = temp_set_for_b.pop()
-
-        # Determine `g` using all other known segments
-        self.segment_map["g"] = next(
-            s
-            for s in DigitTranslator.ALL_SEGMENTS
-            if s not in self.segment_map.values()
-        )
+        # How many of the wirings light each segment
+        segment_frequencies = Counter("".join(wirings))
 
-        # Finally we convert the basic (digit, normal segment map) pairs into
-        # (digit, translated segment map) pairs using the translations from `self.segment_map`
-        self.digit_translations = [
-            (d, {self.segment_map[s] for s in sm})
-            for d, sm in DigitTranslator.DIGIT_AND_SEGMENT_MAPS
-        ]
+        self.mask_digits = {
+            self.to_mask(wiring): DigitTranslator.SCORE_DIGITS[
+                sum(map(segment_frequencies.__getitem__, wiring))
+            ]
+            for wiring in wirings
+        }
+        if len(set(self.mask_digits.values())) != 10:
+            raise Exception()
 
     def translate(self, powered_segments: str):
         """Translate a given wiring into a digit"""
-        powered_set = {c for c in powered_segments}
-
-        return next(
-            digit
-            for digit, translation in self.digit_translations
-            if powered_set == translation
-        )
+        return self.mask_digits[self.to_mask(powered_segments)]
 
 
 def part_2():
-    data = get_question_input(8)
     output_total = 0
 
-    for line in data:
-        wirings, outputs = [s.split() for s in line.split(" | ")]
+    for wirings, outputs in __parse_displays():
         translator = DigitTranslator(wirings)
 
-        human_digit_str = "".join(
-            str(translator.translate(output)) for output in outputs
-        )
-        output_total += int(human_digit_str)
+        output_value = 0
+        for output in outputs:
+            output_value = output_value * 10 + translator.translate(output)
+        output_total += output_value
 
     print(output_total)
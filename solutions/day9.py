@@ -1,4 +1,5 @@
 import sys
+from libraries.input_cache import cached_parse
 from libraries.print_util import make_red
 from libraries.questions import get_question_input
 
@@ -25,7 +26,8 @@ def __get_adjacent_indices(map: list[list[int]], row: int, col: int):
     return adjacent_indices
 
 
-def part_1():
+@cached_parse(9)
+def __parse_heightmap() -> list[list[int]]:
     data = get_question_input(9)
     heightmap = [[int(h) for h in next(data)]]
     map_width = len(heightmap[0])
@@ -36,6 +38,11 @@ def part_1():
 
         heightmap.append([int(h) for h in line])
 
+    return heightmap
+
+
+def part_1():
+    heightmap = __parse_heightmap()
     risk_sum = 0
     low_points: list[tuple[int, int]] = []
 